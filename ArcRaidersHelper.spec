@@ -25,11 +25,22 @@ a = Analysis(
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    # Large packages the app never imports; pruning them shortens analysis
+    excludes=[
+        'matplotlib',
+        'IPython',
+        'tornado',
+        'numpy.f2py',
+        'pytest',
+        'setuptools',  # Build-time only; nothing bundled imports it or pkg_resources
+        'pip',
+        'test',
+    ],
     win_no_prefer_redirects=False,
     win_private_assemblies=False,
     cipher=block_cipher,
     noarchive=False,
+    optimize=1,  # Strip asserts; docstrings stay for libraries that read __doc__
 )
 
 pyz = PYZ(a.pure, a.zipped_data, cipher=block_cipher)
@@ -1,12 +1,15 @@
 """Build script to create standalone executable."""
 
+import argparse
 import logging
+import os
 import shutil
+import subprocess
 import sys
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import PyInstaller.__main__
-
 # Setup logging for build script
 logging.basicConfig(
     level=logging.INFO,
@@ -21,93 +24,163 @@ DIST = ROOT / "dist"
 BUILD = ROOT / "build"
 OUTPUT = DIST / "ArcRaidersHelper"
 TESSERACT_SRC = Path(r"C:\Program Files\Tesseract-OCR")
-
-
-def build():
-    """Build the executable."""
+TESSDATA_FILES = {"eng.traineddata", "osd.traineddata"}
+
+
+def _tesseract_ignore(_dirname: str, names: list[str]) -> set[str]:
+    """Select only executables, DLLs and the needed tessdata files to bundle."""
+    return {
+        name
+        for name in names
+        if not (
+            name.endswith((".exe", ".dll"))
+            or name == "tessdata"
+            or name in TESSDATA_FILES
+        )
+    }
+
+
+def _iter_files(path: Path | str) -> Iterator[os.DirEntry]:
+    """Recursively yield file entries below path, reusing scandir's cached stats."""
+    with os.scandir(path) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_files(entry.path)
+            elif entry.is_file(follow_symlinks=False):
+                yield entry
+
+
+def _total_size(path: Path | str) -> int:
+    """
+    Get the total size in bytes of all files below path.
+
+    On Windows, scandir is backed by FindFirstFileW/FindNextFileW and
+    DirEntry.stat() answers from those enumeration records, so sizes come
+    from the directory listing without opening each file.
+    """
+    return sum(entry.stat(follow_symlinks=False).st_size for entry in _iter_files(path))
+
+
+def build(*, fresh: bool = False):
+    """
+    Build the executable.
+
+    Args:
+        fresh: If True, also wipe PyInstaller's build cache for a full rebuild
+    """
     logger.info("Starting build process...")
 
-    # Clean previous builds
+    # Clean previous builds (build/ holds PyInstaller's analysis cache, keep it
+    # unless a fresh build is requested)
     if DIST.exists():
         logger.info("Cleaning previous dist folder...")
         shutil.rmtree(DIST)
-    if BUILD.exists():
+    if fresh and BUILD.exists():
         logger.info("Cleaning previous build folder...")
         shutil.rmtree(BUILD)
 
-    # Build main app using spec file
-    logger.info("Building main application...")
-    PyInstaller.__main__.run(
-        [
-            "ArcRaidersHelper.spec",
-            "--clean",
-        ]
-    )
-    logger.info("Main application built successfully")
-
-    # Build calibration tool
-    logger.info("Building calibration tool...")
-    PyInstaller.__main__.run(
-        [
-            "src/arc_helper/calibrate.py",
-            "--name=Calibrate",
-            "--onedir",
-            "--windowed",
-            "--distpath",
-            str(DIST),
-            "--clean",
-        ]
-    )
-    logger.info("Calibration tool built successfully")
+    # Build main app and calibration tool in parallel. They are independent,
+    # so each gets its own PyInstaller process and work directory.
+    logger.info("Building main application and calibration tool...")
+    jobs = {
+        "Main application": subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "PyInstaller",
+                "ArcRaidersHelper.spec",
+                "--workpath",
+                str(BUILD / "main"),
+                "--noconfirm",
+            ]
+        ),
+        "Calibration tool": subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                "PyInstaller",
+                "src/arc_helper/calibrate.py",
+                "--name=Calibrate",
+                "--onedir",
+                "--windowed",
+                "--distpath",
+                str(DIST),
+                "--workpath",
+                str(BUILD / "calibrate"),
+                "--noconfirm",
+            ]
+        ),
+    }
+
+    failed = []
+    for name, process in jobs.items():
+        if process.wait() != 0:
+            logger.error("%s build failed (exit code %d)", name, process.returncode)
+            failed.append(name)
+        else:
+            logger.info("%s built successfully", name)
+    if failed:
+        msg = f"PyInstaller failed for: {', '.join(failed)}"
+        raise RuntimeError(msg)
+
+    copies: list[tuple[Path, Path]] = []
 
     # Move calibrate exe to main folder
     calibrate_dir = DIST / "Calibrate"
-    if calibrate_dir.exists():
-        calibrate_exe = calibrate_dir / "Calibrate.exe"
-        if calibrate_exe.exists():
-            logger.info("Moving Calibrate.exe to output folder...")
-            shutil.copy(calibrate_exe, OUTPUT / "Calibrate.exe")
-        shutil.rmtree(calibrate_dir)
+    calibrate_exe = calibrate_dir / "Calibrate.exe"
+    if calibrate_exe.exists():
+        logger.info("Moving Calibrate.exe to output folder...")
+        copies.append((calibrate_exe, OUTPUT / "Calibrate.exe"))
 
     # Copy user-editable files
     logger.info("Copying configuration files...")
-    shutil.copy(ROOT / ".env.example", OUTPUT / ".env.example")
-    shutil.copy(ROOT / ".env.example", OUTPUT / ".env")
-    shutil.copy(ROOT / "items.csv", OUTPUT / "items.csv")
-    shutil.copy(ROOT / "items.db", OUTPUT / "items.db")
-    shutil.copy(
-        ROOT / "src" / "arc_helper" / "resolutions.json", OUTPUT / "resolutions.json"
+    # Both config files come from the same source, so read it only once.
+    # Written as separate files (not hardlinks) since users edit .env.
+    env_example = (ROOT / ".env.example").read_bytes()
+    (OUTPUT / ".env.example").write_bytes(env_example)
+    (OUTPUT / ".env").write_bytes(env_example)
+    copies.extend(
+        [
+            (ROOT / "items.csv", OUTPUT / "items.csv"),
+            (ROOT / "items.db", OUTPUT / "items.db"),
+            (
+                ROOT / "src" / "arc_helper" / "resolutions.json",
+                OUTPUT / "resolutions.json",
+            ),
+        ]
     )
     if (ROOT / "README.md").exists():
-        shutil.copy(ROOT / "README.md", OUTPUT / "README.md")
+        copies.append((ROOT / "README.md", OUTPUT / "README.md"))
+
+    # The copies are independent and I/O bound, so overlap them. copyfile
+    # skips copying permission bits, which the fresh output doesn't need.
+    sources, destinations = zip(*copies, strict=True)
+    with ThreadPoolExecutor(max_workers=min(8, (os.cpu_count() or 1) * 2)) as pool:
+        list(pool.map(shutil.copyfile, sources, destinations))
+    if os.name != "nt" and (OUTPUT / "Calibrate.exe").exists():
+        (OUTPUT / "Calibrate.exe").chmod(0o755)
+
+    if calibrate_dir.exists():
+        shutil.rmtree(calibrate_dir)
 
     # Bundle Tesseract
     tesseract_dest = OUTPUT / "tesseract"
     if TESSERACT_SRC.exists():
         logger.info("Bundling Tesseract from %s...", TESSERACT_SRC)
 
-        tesseract_dest.mkdir(exist_ok=True)
-
-        for file in TESSERACT_SRC.glob("*.exe"):
-            shutil.copy(file, tesseract_dest)
-        for file in TESSERACT_SRC.glob("*.dll"):
-            shutil.copy(file, tesseract_dest)
-
-        tessdata_dest = tesseract_dest / "tessdata"
-        tessdata_dest.mkdir(exist_ok=True)
-        tessdata_src = TESSERACT_SRC / "tessdata"
-
-        for filename in ["eng.traineddata", "osd.traineddata"]:
-            src = tessdata_src / filename
-            if src.exists():
-                shutil.copy(src, tessdata_dest)
+        shutil.copytree(
+            TESSERACT_SRC,
+            tesseract_dest,
+            ignore=_tesseract_ignore,
+            dirs_exist_ok=True,
+        )
 
         logger.info("Tesseract bundled successfully")
     else:
         logger.warning("Tesseract not found at %s", TESSERACT_SRC)
 
     # Summary
-    total_size = sum(f.stat().st_size for f in OUTPUT.rglob("*") if f.is_file())
+    total_size = _total_size(OUTPUT)
 
     logger.info("=" * 50)
     logger.info("Build complete!")
@@ -116,5 +189,17 @@ def build():
     logger.info(f"Total size: {total_size / 1024 / 1024:.1f} MB")
 
 
+def main():
+    """Parse command line arguments and run the build."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "--fresh",
+        action="store_true",
+        help="Delete the PyInstaller build cache before building",
+    )
+    args = parser.parse_args()
+    build(fresh=args.fresh)
+
+
 if __name__ == "__main__":
-    build()
+    main()
@@ -6,31 +6,34 @@ Helps configure screen regions for trigger and tooltip detection.
 # Enable windows DPI scaling
 import ctypes
 import tkinter as tk
+from collections.abc import Callable
+from collections.abc import Iterator
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import suppress
+from dataclasses import dataclass
 from pathlib import Path
 from tkinter import filedialog
 from tkinter import messagebox
 from tkinter import ttk
+from typing import TypeVar
 
-import pytesseract
-from PIL import ImageGrab
+import numpy as np
+from PIL import Image
 from PIL import ImageTk
 
+from arc_helper.capture import grab_region
 from arc_helper.config import APP_DIR
-from arc_helper.config import OverlaySettings
-from arc_helper.config import ScanSettings
-from arc_helper.config import Settings
-from arc_helper.config import StationLevelSettings
-from arc_helper.config import TooltipCaptureSettings
-from arc_helper.config import TooltipRegion
-from arc_helper.config import TriggerRegion
-from arc_helper.config import TriggerRegion2
+from arc_helper.config import RegionMixin
+from arc_helper.config import get_logger
 from arc_helper.config import get_screen_resolution
 from arc_helper.config import get_settings
 from arc_helper.config import logger
 from arc_helper.database import get_database
 from arc_helper.ocr import get_ocr_engine
 
+T = TypeVar("T")
+
 try:
     # Windows 10 1607+ (most reliable)
     ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
@@ -39,6 +42,68 @@ except (AttributeError, OSError):
         # Fallback for older Windows
         ctypes.windll.user32.SetProcessDPIAware()
 
+# Trailing-edge debounce for slider-driven overlay updates (~one 60Hz frame)
+SLIDER_DEBOUNCE_MS = 16
+
+
+def _shadow_int(owner: object, attr: str, var: tk.IntVar) -> None:
+    """Mirror `var` into `owner.<attr>` so hot paths read a plain int."""
+    setattr(owner, attr, var.get())
+    var.trace_add("write", lambda *_: setattr(owner, attr, var.get()))
+
+
+class OverlayHost:
+    """
+    Fullscreen click-through window that draws every calibration overlay.
+
+    Each region is a rectangle on one shared canvas rather than its own
+    Toplevel, so all overlays redraw together in a single window.
+    """
+
+    # Canvas background colour made fully transparent (and click-through)
+    TRANSPARENT = "black"
+
+    def __init__(self, screen_width: int, screen_height: int):
+        self.window = tk.Toplevel()
+        self.window.withdraw()
+        self.window.overrideredirect(boolean=True)
+        self.window.attributes("-topmost", True, "-alpha", 0.4)  # noqa: FBT003
+        with suppress(tk.TclError):  # Windows only
+            self.window.attributes("-transparentcolor", self.TRANSPARENT)
+        self.window.geometry(f"{screen_width}x{screen_height}+0+0")
+
+        self.canvas = tk.Canvas(self.window, bg=self.TRANSPARENT, highlightthickness=0)
+        self.canvas.pack(fill="both", expand=True)
+
+        self._shown: set[int] = set()
+
+    def add_rect(self, color: str) -> int:
+        """Create a hidden rectangle and return its canvas item id."""
+        return self.canvas.create_rectangle(
+            0, 0, 0, 0, fill=color, outline="", state="hidden"
+        )
+
+    def move(self, rect_id: int, bbox: tuple[int, int, int, int]) -> None:
+        """Set a rectangle's (left, top, right, bottom)."""
+        self.canvas.coords(rect_id, *bbox)
+
+    def show(self, rect_id: int) -> None:
+        """Show a rectangle, mapping the window if it was hidden."""
+        # Repeated Show clicks only need the move the caller already did
+        if rect_id in self._shown:
+            return
+        self.canvas.itemconfigure(rect_id, state="normal")
+        if not self._shown:
+            self.window.deiconify()
+        self._shown.add(rect_id)
+
+    def hide(self, rect_id: int) -> None:
+        """Hide a rectangle, withdrawing the window once none are shown."""
+        self.canvas.itemconfigure(rect_id, state="hidden")
+        self._shown.discard(rect_id)
+        if not self._shown:
+            self.window.withdraw()
+
 
 class RegionSelector:
     """Widget for configuring a screen region."""
@@ -46,6 +111,7 @@ class RegionSelector:
     def __init__(
         self,
         parent: ttk.Frame,
+        host: OverlayHost,
         title: str,
         initial_x: int,
         initial_y: int,
@@ -63,8 +129,28 @@ class RegionSelector:
         self.width = tk.IntVar(value=initial_width)
         self.height = tk.IntVar(value=initial_height)
 
-        # Overlay window for visualization
-        self.overlay: tk.Toplevel | None = None
+        # Plain-int copies of the values, read without a Tcl round-trip
+        self._x: int
+        self._y: int
+        self._w: int
+        self._h: int
+        _shadow_int(self, "_x", self.x)
+        _shadow_int(self, "_y", self.y)
+        _shadow_int(self, "_w", self.width)
+        _shadow_int(self, "_h", self.height)
+
+        # Memoized bbox, dropped whenever any of the values is written
+        self._bbox: tuple[int, int, int, int] | None = None
+        for var in (self.x, self.y, self.width, self.height):
+            var.trace_add("write", self._invalidate_bbox)
+
+        # Rectangle on the shared overlay for visualization
+        self.host = host
+        self._rect_id = host.add_rect(color)
+        self.visible = False
+
+        # Pending `after` id for coalesced slider updates
+        self._pending_after: str | None = None
 
         self._setup_ui()
 
@@ -92,53 +178,73 @@ class RegionSelector:
                 variable=var,
                 orient="horizontal",
                 length=200,
-                command=lambda _: self._on_change(),
             )
             slider.grid(row=row, column=1, sticky="ew", padx=5)
+            slider.bind("<ButtonRelease-1>", self._flush_change)
+            var.trace_add("write", self._schedule_change)
 
             value_label = ttk.Label(frame, textvariable=var, width=5)
             value_label.grid(row=row, column=2)
 
         frame.columnconfigure(1, weight=1)
 
+    def _schedule_change(self, *_args) -> None:
+        """Coalesce slider writes into at most one overlay update per frame."""
+        if self._pending_after is None:
+            self._pending_after = self.parent.after(
+                SLIDER_DEBOUNCE_MS, self._flush_change
+            )
+
+    def _cancel_change(self) -> None:
+        """Drop a pending slider update."""
+        if self._pending_after is not None:
+            self.parent.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _flush_change(self, _event=None) -> None:
+        """Apply any pending slider change immediately."""
+        self._cancel_change()
+        self._on_change()
+
     def _on_change(self) -> None:
         """Update overlay when values change."""
-        if self.overlay and self.overlay.winfo_exists():
+        if self.visible:
             self._update_overlay()
 
     def show_overlay(self) -> None:
         """Show colored rectangle on screen."""
-        if self.overlay:
-            self.overlay.destroy()
-
-        self.overlay = tk.Toplevel()
-        self.overlay.attributes("-alpha", 0.4)
-        self.overlay.overrideredirect(boolean=True)
-        self.overlay.config(bg=self.color)
-
+        self.visible = True
         self._update_overlay()
+        self.host.show(self._rect_id)
 
     def _update_overlay(self) -> None:
         """Update overlay position and size."""
-        if self.overlay and self.overlay.winfo_exists():
-            self.overlay.geometry(
-                f"{self.width.get()}x{self.height.get()}+{self.x.get()}+{self.y.get()}"
-            )
+        if not self.visible:
+            return
+
+        with suppress(tk.TclError):
+            self.host.move(self._rect_id, self.get_bbox())
 
     def hide_overlay(self) -> None:
         """Hide the overlay."""
-        if self.overlay:
-            try:
-                if self.overlay.winfo_exists():
-                    self.overlay.destroy()
-            except tk.TclError:
-                pass  # Window already destroyed
-            self.overlay = None
+        if not self.visible:
+            return
+
+        self.visible = False
+        self._cancel_change()
+        with suppress(tk.TclError):
+            self.host.hide(self._rect_id)
+
+    def _invalidate_bbox(self, *_args) -> None:
+        """Forget the memoized bbox after a value change."""
+        self._bbox = None
 
     def get_bbox(self) -> tuple[int, int, int, int]:
         """Get region as (left, top, right, bottom)."""
-        x, y = self.x.get(), self.y.get()
-        return (x, y, x + self.width.get(), y + self.height.get())
+        if self._bbox is None:
+            x, y = self._x, self._y
+            self._bbox = (x, y, x + self._w, y + self._h)
+        return self._bbox
 
 
 class TooltipCaptureConfig:
@@ -147,12 +253,15 @@ class TooltipCaptureConfig:
     def __init__(
         self,
         parent: ttk.Frame,
+        host: OverlayHost,
         initial_width: int,
         initial_height: int,
         initial_offset_x: int,
         initial_offset_y: int,
+        screen_width: int,
     ):
         self.parent = parent
+        self._screen_w = screen_width
 
         # Current values
         self.width = tk.IntVar(value=initial_width)
@@ -160,9 +269,28 @@ class TooltipCaptureConfig:
         self.offset_x = tk.IntVar(value=initial_offset_x)
         self.offset_y = tk.IntVar(value=initial_offset_y)
 
-        # Overlay window for visualization
-        self.overlay: tk.Toplevel | None = None
+        # Plain-int copies of the values, read without a Tcl round-trip
+        self._w: int
+        self._h: int
+        self._ox: int
+        self._oy: int
+        _shadow_int(self, "_w", self.width)
+        _shadow_int(self, "_h", self.height)
+        _shadow_int(self, "_ox", self.offset_x)
+        _shadow_int(self, "_oy", self.offset_y)
+
+        # Rectangle on the shared overlay for visualization
+        self.host = host
+        self._rect_id = host.add_rect("green")
         self.is_tracking = False
+        self._track_after: str | None = None
+
+        # Cursor tracking poll interval; raise on slower machines
+        self.tracking_interval_ms = 50
+        self._last_bbox: tuple[int, int, int, int] | None = None
+
+        # Pending `after` id for coalesced slider updates
+        self._pending_after: str | None = None
 
         self._setup_ui()
 
@@ -199,96 +327,121 @@ class TooltipCaptureConfig:
                 variable=var,
                 orient="horizontal",
                 length=200,
-                command=lambda _: self._on_change(),
             )
             slider.grid(row=row, column=1, sticky="ew", padx=5)
+            slider.bind("<ButtonRelease-1>", self._flush_change)
+            var.trace_add("write", self._schedule_change)
 
             value_label = ttk.Label(frame, textvariable=var, width=6)
             value_label.grid(row=row, column=2)
 
         frame.columnconfigure(1, weight=1)
 
+    def _schedule_change(self, *_args) -> None:
+        """Coalesce slider writes into at most one overlay update per frame."""
+        if self._pending_after is None:
+            self._pending_after = self.parent.after(
+                SLIDER_DEBOUNCE_MS, self._flush_change
+            )
+
+    def _cancel_change(self) -> None:
+        """Drop a pending slider update."""
+        if self._pending_after is not None:
+            self.parent.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _flush_change(self, _event=None) -> None:
+        """Apply any pending slider change immediately."""
+        self._cancel_change()
+        self._on_change()
+
     def _on_change(self) -> None:
         """Update overlay when values change."""
-        if self.overlay and self.overlay.winfo_exists():
+        if self.is_tracking:
             self._update_overlay_position()
 
     def start_tracking(self) -> None:
         """Start showing overlay that follows cursor."""
-        if self.overlay:
-            self.stop_tracking()
-
-        self.overlay = tk.Toplevel()
-        self.overlay.attributes("-topmost", True)  # noqa: FBT003
-        self.overlay.attributes("-alpha", 0.3)
-        self.overlay.overrideredirect(boolean=True)
-        self.overlay.config(bg="green")
+        if self.is_tracking:
+            return
 
         self.is_tracking = True
+        self._update_overlay_position()
+        self.host.show(self._rect_id)
         self._track_cursor()
 
     def _track_cursor(self) -> None:
         """Update overlay position to follow cursor."""
-        if not self.is_tracking or not self.overlay:
+        self._track_after = None
+        if not self.is_tracking:
             return
 
         try:
-            if not self.overlay.winfo_exists():
-                self.is_tracking = False
-                return
-
             self._update_overlay_position()
 
-            # Schedule next update (50ms = 20fps)
-            self.overlay.after(50, self._track_cursor)
+            self._track_after = self.parent.after(
+                self.tracking_interval_ms, self._track_cursor
+            )
 
         except tk.TclError:
             self.is_tracking = False
 
     def _update_overlay_position(self) -> None:
         """Update overlay to current cursor position + offset."""
-        if not self.overlay or not self.overlay.winfo_exists():
+        if not self.is_tracking:
             return
 
         try:
-            x = self.overlay.winfo_pointerx()
-            y = self.overlay.winfo_pointery()
+            x = self.parent.winfo_pointerx()
+            y = self.parent.winfo_pointery()
         except tk.TclError:
             return
 
-        # TODO: uncomment the following once correct percentages
-        # for screen thresholds have been found and implemented.
-        # screen_width, _ = get_screen_resolution()
-
-        # Check if cursor is in right 30% of screen
-        # right_threshold = screen_width * 0.7
-
-        # if x > right_threshold:
-        #     # Flip X offset (and account for capture width)
-        #     offset_x = -self.offset_x.get() - self.width.get()
-        # else:
-        #     offset_x = self.offset_x.get()
-        offset_x = self.offset_x.get()
+        # TODO: flip the X offset in the right part of the screen once correct
+        # percentages for screen thresholds have been found and implemented
+        offset_x = self._ox
 
         left = x + offset_x
-        top = y + self.offset_y.get()
+        top = y + self._oy
+        bbox = (left, top, left + self._w, top + self._h)
+
+        # Skip the Tk coords call when nothing has moved
+        if bbox == self._last_bbox:
+            return
+        self._last_bbox = bbox
 
-        self.overlay.geometry(f"{self.width.get()}x{self.height.get()}+{left}+{top}")
+        self.host.move(self._rect_id, bbox)
 
     def stop_tracking(self) -> None:
         """Stop tracking and hide overlay."""
+        if not self.is_tracking:
+            return
+
         self.is_tracking = False
-        if self.overlay:
-            try:
-                if self.overlay.winfo_exists():
-                    self.overlay.destroy()
-            except tk.TclError:
-                pass
-            self.overlay = None
-
-    def capture_at_cursor(self) -> tuple[ImageGrab.Image, int, int] | None:
+        self._cancel_change()
+        with suppress(tk.TclError):
+            if self._track_after is not None:
+                self.parent.after_cancel(self._track_after)
+                self._track_after = None
+            self.host.hide(self._rect_id)
+
+    def capture_at_cursor(self) -> tuple[Image.Image, int, int] | None:
         """Capture the area at current cursor position."""
+        result = self.bbox_at_cursor()
+        if result is None:
+            return None
+
+        bbox, cursor_x, cursor_y = result
+        return grab_region(bbox), cursor_x, cursor_y
+
+    def bbox_at_cursor(
+        self,
+    ) -> tuple[tuple[int, int, int, int], int, int] | None:
+        """Get the capture bbox at the current cursor position.
 
+        Only reads Tk state, so it must run on the main thread; the grab
+        itself can then happen anywhere.
+        """
         try:
             root = self.parent.winfo_toplevel()
             cursor_x = root.winfo_pointerx()
@@ -296,46 +449,34 @@ class TooltipCaptureConfig:
         except tk.TclError:
             return None
 
-        _screen_width, _ = get_screen_resolution()
-
         # TODO: tooltip flipping on right side of screen, to be implemented properly
-        # Check if cursor is in right 30% of screen
-        # right_threshold = screen_width * 0.7
-
-        # if cursor_x > right_threshold:
-        #     # Flip X offset (and account for capture width)
-        #     offset_x = -self.offset_x.get() - self.width.get()
-        # else:
-        #     offset_x = self.offset_x.get()
-        offset_x = self.offset_x.get()
+        offset_x = self._ox
 
         # Calculate capture region
         left = max(0, cursor_x + offset_x)
-        top = max(0, cursor_y + self.offset_y.get())
-        right = left + self.width.get()
-        bottom = top + self.height.get()
+        top = max(0, cursor_y + self._oy)
+        right = left + self._w
+        bottom = top + self._h
 
-        image = ImageGrab.grab(bbox=(left, top, right, bottom))
-        return image, cursor_x, cursor_y
+        return (left, top, right, bottom), cursor_x, cursor_y
 
 
-class TempRegion:
+@dataclass(slots=True)
+class TempRegion(RegionMixin):
     """Temporary region class for OCR testing."""
 
-    def __init__(self, x: int, y: int, w: int, h: int):
-        self.x = x
-        self.y = y
-        self.width = w
-        self.height = h
-
-    @property
-    def bbox(self) -> tuple[int, int, int, int]:
-        return (self.x, self.y, self.x + self.width, self.y + self.height)
+    x: int
+    y: int
+    width: int
+    height: int
 
 
 class CalibrationTool:
     """Main calibration application."""
 
+    # Rows fetched per page in the item database view
+    VIEW_PAGE_SIZE = 200
+
     def __init__(self):
         self.root = tk.Tk()
         self.root.title("Arc Raiders Helper - Calibration")
@@ -345,8 +486,17 @@ class CalibrationTool:
         # Load current settings
         self.settings = get_settings()
 
-        # OCR engine for testing
+        # Screen size is queried once rather than on every capture
+        self.screen_width, self.screen_height = get_screen_resolution()
+
+        # One shared window draws every region overlay
+        self._overlay_host = OverlayHost(self.screen_width, self.screen_height)
+
+        # OCR engine for testing; captures and OCR run off the Tk thread
         self.ocr = get_ocr_engine()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="calibrate-ocr"
+        )
 
         # Database reference
         self.db = get_database()
@@ -367,11 +517,15 @@ class CalibrationTool:
         canvas.create_window((0, 0), window=scrollable_frame, anchor="nw")
         canvas.configure(yscrollcommand=scrollbar.set)
 
-        # Enable mousewheel scrolling
+        # Enable mousewheel scrolling only while the pointer is over the
+        # canvas, so other windows (e.g. the item view) keep their own wheel
         def _on_mousewheel(event):
             canvas.yview_scroll(int(-1 * (event.delta / 120)), "units")
 
-        canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        canvas.bind(
+            "<Enter>", lambda _: canvas.bind_all("<MouseWheel>", _on_mousewheel)
+        )
+        canvas.bind("<Leave>", lambda _: canvas.unbind_all("<MouseWheel>"))
 
         canvas.pack(side="left", fill="both", expand=True)
         scrollbar.pack(side="right", fill="y")
@@ -398,6 +552,7 @@ class CalibrationTool:
         # =====================================================================
         self.trigger_selector = RegionSelector(
             main_frame,
+            self._overlay_host,
             "Trigger Region 1 (INVENTORY text IN-MENU)",
             self.settings.trigger_region.x,
             self.settings.trigger_region.y,
@@ -427,6 +582,7 @@ class CalibrationTool:
         # =====================================================================
         self.trigger_selector2 = RegionSelector(
             main_frame,
+            self._overlay_host,
             "Trigger Region 2 (INVENTORY text IN-GAME)",
             self.settings.trigger_region2.x,
             self.settings.trigger_region2.y,
@@ -456,10 +612,12 @@ class CalibrationTool:
         # =====================================================================
         self.tooltip_capture = TooltipCaptureConfig(
             main_frame,
+            self._overlay_host,
             initial_width=self.settings.tooltip_capture.width,
             initial_height=self.settings.tooltip_capture.height,
             initial_offset_x=self.settings.tooltip_capture.offset_x,
             initial_offset_y=self.settings.tooltip_capture.offset_y,
+            screen_width=self.screen_width,
         )
 
         tooltip_btn_frame = ttk.Frame(main_frame)
@@ -492,6 +650,7 @@ class CalibrationTool:
             preview_frame, text="Click 'Test OCR' to preview"
         )
         self.preview_label.pack()
+        self._preview_photo: ImageTk.PhotoImage | None = None
 
         self.result_label = ttk.Label(
             preview_frame, text="", font=("Segoe UI", 11, "bold")
@@ -523,6 +682,10 @@ class CalibrationTool:
             side="left", padx=5
         )
 
+        # Shown only while a CSV load is in progress
+        self.csv_progress = ttk.Progressbar(db_frame, mode="determinate", length=100)
+        self._csv_loading = False
+
         ttk.Separator(main_frame, orient="horizontal").pack(fill="x", pady=10)
 
         # =====================================================================
@@ -562,28 +725,40 @@ class CalibrationTool:
         """Test OCR on trigger region 2."""
         self._test_region_for_inventory(self.trigger_selector2)
 
+    def _run_in_background(
+        self, work: Callable[[], T], on_done: Callable[[Future[T]], None]
+    ) -> None:
+        """Run `work` on the OCR worker, then `on_done` on the Tk thread."""
+
+        def _marshal(future: Future[T]) -> None:
+            with suppress(RuntimeError, tk.TclError):  # root already destroyed
+                self.root.after(0, on_done, future)
+
+        self._executor.submit(work).add_done_callback(_marshal)
+
     def _test_region_for_inventory(self, selector: RegionSelector) -> None:
         """Test a region for INVENTORY text."""
         bbox = selector.get_bbox()
-        logger.info(f"Testing bbox: {bbox}")  # Debug
+        logger.info("Testing bbox: %s", bbox)  # Debug
 
-        image = ImageGrab.grab(bbox=bbox)
-        logger.info(f"Captured image: {image.size}, mode: {image.mode}")  # Debug
+        def work() -> tuple[Image.Image, bool]:
+            image = grab_region(bbox)
+            logger.info("Captured image: %s, mode: %s", image.size, image.mode)
+            return image, self.ocr.check_trigger_image(image)
 
-        self._show_preview(image)
+        self._run_in_background(work, self._apply_trigger_result)
 
-        region = TempRegion(
-            selector.x.get(),
-            selector.y.get(),
-            selector.width.get(),
-            selector.height.get(),
-        )
-        logger.info(
-            f"Region: x={region.x}, y={region.y}, w={region.width}, h={region.height}"
-        )  # Debug
+    def _apply_trigger_result(self, future: Future[tuple[Image.Image, bool]]) -> None:
+        """Show the outcome of a trigger region test."""
+        try:
+            image, found = future.result()
+        except Exception as e:  # noqa: BLE001
+            logger.info("OCR Error: %s", e)  # Debug
+            self.result_label.config(text=f"✗ OCR Error: {e}", foreground="red")
+            return
 
-        found = self.ocr.check_trigger(region)
-        logger.info(f"Trigger found: {found}")  # Debug
+        logger.info("Trigger found: %s", found)  # Debug
+        self._show_preview(image)
 
         if found:
             self.result_label.config(text="✓ INVENTORY detected!", foreground="green")
@@ -592,10 +767,8 @@ class CalibrationTool:
 
     def _test_tooltip(self) -> None:
         """Test OCR on tooltip region."""
+        # Tk variables are only read here, on the main thread
         bbox = self.tooltip_capture.get_bbox()
-        image = ImageGrab.grab(bbox=bbox)
-        self._show_preview(image)
-
         region = TempRegion(
             self.tooltip_capture.offset_x.get(),
             self.tooltip_capture.offset_y.get(),
@@ -603,12 +776,10 @@ class CalibrationTool:
             self.tooltip_capture.height.get(),
         )
 
-        item_name = self.ocr.extract_item_name(region)
+        def work() -> tuple[Image.Image, str | None]:
+            return grab_region(bbox), self.ocr.extract_item_name(region)
 
-        if item_name:
-            self.result_label.config(text=f"✓ Found: '{item_name}'", foreground="green")
-        else:
-            self.result_label.config(text="✗ No text detected", foreground="red")
+        self._run_in_background(work, self._apply_tooltip_result)
 
     def _show_preview(self, image) -> None:
         """Show image preview."""
@@ -616,58 +787,82 @@ class CalibrationTool:
         if image.mode != "RGB":
             image = image.convert("RGB")
 
-        display_width = min(350, image.width)
-        ratio = display_width / image.width
-        display_height = int(image.height * ratio)
-        display_img = image.resize((display_width, display_height))
+        # Decimate by an integer step to fit 350px wide: a strided numpy view,
+        # so only the kept pixels are copied and the caller's image is untouched.
+        # Images already within bounds (trigger regions) skip the round trip.
+        step = -(-image.width // 350)
+        if step > 1:
+            image = Image.fromarray(np.asarray(image)[::step, ::step])
+
+        # Repeat tests of the same region paste into the existing photo
+        photo = self._preview_photo
+        if photo is not None and (photo.width(), photo.height()) == image.size:
+            photo.paste(image)
+            return
 
-        photo = ImageTk.PhotoImage(display_img)
+        photo = ImageTk.PhotoImage(image)
         self.preview_label.config(image=photo)
-        self.preview_label.image = photo  # Keep reference
+        self._preview_photo = photo  # Keep reference
 
     def _test_tooltip_at_cursor(self) -> None:
         """Test OCR on tooltip at current cursor position."""
         logger.info("Testing tooltip at cursor...")  # Debug
 
-        result = self.tooltip_capture.capture_at_cursor()
+        result = self.tooltip_capture.bbox_at_cursor()
 
         if result is None:
             logger.info("Failed to capture")  # Debug
             self.result_label.config(text="✗ Failed to capture", foreground="red")
-            self.root.update()
+            self._refresh_idle()
             return
 
-        image, cursor_x, cursor_y = result
-        logger.info(
-            f"Captured at cursor ({cursor_x}, {cursor_y}), image size: {image.size}"
-        )  # Debug
+        bbox, cursor_x, cursor_y = result
 
-        self._show_preview(image)
+        def work() -> tuple[Image.Image, str | None]:
+            image = grab_region(bbox)
+            logger.info(
+                "Captured at cursor (%d, %d), image size: %s",
+                cursor_x,
+                cursor_y,
+                image.size,
+            )  # Debug
 
-        # Use the OCR engine's tooltip preprocessing
-        processed = self.ocr.preprocess_tooltip(image)
-        logger.info(f"Preprocessed image size: {processed.size}")  # Debug
+            # Use the OCR engine's tooltip preprocessing
+            processed = self.ocr.preprocess_tooltip(image)
+            logger.info("Preprocessed image size: %s", processed.size)  # Debug
 
-        try:
-            text = pytesseract.image_to_string(processed, config="--psm 6")
-            logger.info(f"Raw OCR text: {text!r}")  # Debug
+            text = self.ocr.read_tooltip_text(processed)
+            logger.info("Raw OCR text: %r", text)  # Debug
 
-            item_name = self.ocr.parse_item_name_from_tooltip(text)
-            logger.info(f"Parsed item name: {item_name}")  # Debug
+            return image, self.ocr.parse_item_name_from_tooltip(text)
 
-            if item_name:
-                self.result_label.config(
-                    text=f"✓ Found: '{item_name}'", foreground="green"
-                )
-            else:
-                self.result_label.config(
-                    text="✗ No item name detected", foreground="red"
-                )
+        self._run_in_background(work, self._apply_tooltip_result)
+
+    def _apply_tooltip_result(
+        self, future: Future[tuple[Image.Image, str | None]]
+    ) -> None:
+        """Show the outcome of a tooltip OCR test."""
+        try:
+            image, item_name = future.result()
         except Exception as e:  # noqa: BLE001
-            logger.info(f"OCR Error: {e}")  # Debug
+            logger.info("OCR Error: %s", e)  # Debug
             self.result_label.config(text=f"✗ OCR Error: {e}", foreground="red")
+            self._refresh_idle()
+            return
 
-        self.root.update()  # Force UI update
+        logger.info("Parsed item name: %s", item_name)  # Debug
+        self._show_preview(image)
+
+        if item_name:
+            self.result_label.config(text=f"✓ Found: '{item_name}'", foreground="green")
+        else:
+            self.result_label.config(text="✗ No item name detected", foreground="red")
+
+        self._refresh_idle()
+
+    def _refresh_idle(self) -> None:
+        """Redraw pending widget changes without re-entering the event loop."""
+        self.root.update_idletasks()
 
     # =========================================================================
     # Configuration Methods
@@ -675,43 +870,26 @@ class CalibrationTool:
 
     def _save_config(self) -> None:
         """Save configuration to .env file."""
-        settings = Settings(
-            trigger_region=TriggerRegion(
-                x=self.trigger_selector.x.get(),
-                y=self.trigger_selector.y.get(),
-                width=self.trigger_selector.width.get(),
-                height=self.trigger_selector.height.get(),
-            ),
-            trigger_region2=TriggerRegion2(
-                x=self.trigger_selector2.x.get(),
-                y=self.trigger_selector2.y.get(),
-                width=self.trigger_selector2.width.get(),
-                height=self.trigger_selector2.height.get(),
-            ),
-            tooltip_region=TooltipRegion(
-                x=0,  # No longer used, but keep for compatibility
-                y=0,
-                width=100,
-                height=100,
-            ),
-            tooltip_capture=TooltipCaptureSettings(
-                width=self.tooltip_capture.width.get(),
-                height=self.tooltip_capture.height.get(),
-                offset_x=self.tooltip_capture.offset_x.get(),
-                offset_y=self.tooltip_capture.offset_y.get(),
-            ),
-            overlay=OverlaySettings(),
-            scan=ScanSettings(),
-            stations=StationLevelSettings(
-                gear_bench=self.station_vars["gear_bench"].get(),
-                gunsmith=self.station_vars["gunsmith"].get(),
-                medical_lab=self.station_vars["medical_lab"].get(),
-                explosives_station=self.station_vars["explosives_station"].get(),
-                utility_station=self.station_vars["utility_station"].get(),
-                refiner=self.station_vars["refiner"].get(),
-                scrappy=self.station_vars["scrappy"].get(),
-            ),
-        )
+        # Update the loaded settings in place: rebuilding Settings would
+        # re-read .env and drop fields this tool does not edit
+        settings = self.settings
+        for region, selector in (
+            (settings.trigger_region, self.trigger_selector),
+            (settings.trigger_region2, self.trigger_selector2),
+        ):
+            region.x = selector.x.get()
+            region.y = selector.y.get()
+            region.width = selector.width.get()
+            region.height = selector.height.get()
+
+        capture = settings.tooltip_capture
+        capture.width = self.tooltip_capture.width.get()
+        capture.height = self.tooltip_capture.height.get()
+        capture.offset_x = self.tooltip_capture.offset_x.get()
+        capture.offset_y = self.tooltip_capture.offset_y.get()
+
+        for name, var in self.station_vars.items():
+            setattr(settings.stations, name, var.get())
 
         settings.save_to_env()
         messagebox.showinfo("Saved", "Configuration saved to .env file!")
@@ -757,11 +935,21 @@ class CalibrationTool:
             initialdir=APP_DIR,
         )
 
-        if not filepath:
-            return  # User cancelled
+        if not filepath or self._csv_loading:
+            return  # User cancelled or a load is already running
+
+        # Insert in batches between Tk events so the window stays responsive
+        self._csv_loading = True
+        self.csv_progress.config(value=0)
+        self.csv_progress.pack(side="left", padx=5)
+        self.root.after(10, self._pump_csv, self.db.iter_load_csv(filepath), filepath)
 
+    def _pump_csv(self, loader: Iterator[tuple[int, int, int]], filepath: str) -> None:
+        """Load the next CSV batch, then reschedule until the load finishes."""
         try:
-            self.db.load_csv(filepath)
+            processed, total, _ = next(loader)
+        except StopIteration:
+            self._finish_csv_load()
             self._update_item_count()
             messagebox.showinfo(
                 "Success",
@@ -769,13 +957,22 @@ class CalibrationTool:
                 f"Database now contains {self.db.count()} items.",
             )
         except Exception as e:  # noqa: BLE001
+            self._finish_csv_load()
             messagebox.showerror("Error", f"Failed to load CSV:\n\n{e}")
+        else:
+            self.csv_progress.config(maximum=total, value=processed)
+            self.root.after(10, self._pump_csv, loader, filepath)
+
+    def _finish_csv_load(self) -> None:
+        """Hide the CSV progress bar and allow another load."""
+        self._csv_loading = False
+        self.csv_progress.pack_forget()
 
     def _view_items(self) -> None:
         """Show a window with all items in the database."""
-        items = self.db.get_all_items()
+        total = self.db.count()
 
-        if not items:
+        if not total:
             messagebox.showinfo(
                 "Database Empty",
                 "No items in database.\n\nLoad a CSV file to add items.",
@@ -802,10 +999,8 @@ class CalibrationTool:
             tree_frame,
             columns=("name", "action", "recycle_for", "keep_for", "sell_price"),
             show="headings",
-            yscrollcommand=v_scrollbar.set,
             xscrollcommand=h_scrollbar.set,
         )
-        tree.pack(fill="both", expand=True)
 
         v_scrollbar.config(command=tree.yview)
         h_scrollbar.config(command=tree.xview)
@@ -823,25 +1018,43 @@ class CalibrationTool:
         tree.column("keep_for", width=150, minwidth=80)
         tree.column("sell_price", width=80, minwidth=60)
 
-        # Add items
-        for item in items:
-            tree.insert(
-                "",
-                "end",
-                values=(
+        # Items are fetched a page at a time as the user scrolls near the end
+        loaded = 0
+
+        def insert_page() -> None:
+            nonlocal loaded
+            items = self.db.get_items(loaded, self.VIEW_PAGE_SIZE)
+            rows = [
+                (
                     item.name,
                     item.action,
                     item.recycle_for or "",
                     item.keep_for or "",
                     item.sell_price or "",
-                ),
-            )
+                )
+                for item in items
+            ]
+            insert = tree.insert
+            for values in rows:
+                insert("", "end", values=values)
+            loaded += len(rows)
+
+        def on_yscroll(first: str, last: str) -> None:
+            v_scrollbar.set(first, last)
+            if loaded < total and float(last) > 0.9:
+                insert_page()
+
+        tree.config(yscrollcommand=on_yscroll)
+
+        # First page goes in before the tree is mapped so it lays out once
+        insert_page()
+        tree.pack(fill="both", expand=True)
 
         # Bottom frame
         bottom_frame = ttk.Frame(view_window)
         bottom_frame.pack(fill="x", padx=10, pady=10)
 
-        ttk.Label(bottom_frame, text=f"Total items: {len(items)}").pack(side="left")
+        ttk.Label(bottom_frame, text=f"Total items: {total}").pack(side="left")
 
         ttk.Button(bottom_frame, text="Close", command=view_window.destroy).pack(
             side="right"
@@ -947,14 +1160,16 @@ class CalibrationTool:
 
     def _on_close(self) -> None:
         """Handle window close."""
-        self.trigger_selector.hide_overlay()
-        self.trigger_selector2.hide_overlay()
-        self.tooltip_capture.stop_tracking()  # Changed from tooltip_selector
+        # Destroying the root also tears down the overlay host and any other
+        # Toplevels in one call, so overlays need no individual cleanup
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self.db.close()
         self.root.destroy()
 
 
 def main() -> None:
     """Entry point for calibration tool."""
+    get_logger()
     tool = CalibrationTool()
     tool.run()
 
@@ -0,0 +1,156 @@
+"""
+Screen capture for Arc Raiders Helper.
+Copies only the requested rectangle off the screen via GDI BitBlt on Windows.
+"""
+
+import ctypes
+import threading
+from ctypes import wintypes
+
+from PIL import Image
+from PIL import ImageGrab
+
+SRCCOPY = 0x00CC0020
+DIB_RGB_COLORS = 0
+BI_RGB = 0
+
+
+class BITMAPINFOHEADER(ctypes.Structure):
+    _fields_ = [
+        ("biSize", wintypes.DWORD),
+        ("biWidth", wintypes.LONG),
+        ("biHeight", wintypes.LONG),
+        ("biPlanes", wintypes.WORD),
+        ("biBitCount", wintypes.WORD),
+        ("biCompression", wintypes.DWORD),
+        ("biSizeImage", wintypes.DWORD),
+        ("biXPelsPerMeter", wintypes.LONG),
+        ("biYPelsPerMeter", wintypes.LONG),
+        ("biClrUsed", wintypes.DWORD),
+        ("biClrImportant", wintypes.DWORD),
+    ]
+
+
+try:
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+except AttributeError:
+    # Not on Windows: fall back to PIL for every grab
+    _user32 = _gdi32 = None
+else:
+    # Handles are pointer sized; the default int restype would truncate them
+    _user32.GetDC.argtypes = [wintypes.HWND]
+    _user32.GetDC.restype = wintypes.HDC
+    _user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+    _gdi32.CreateCompatibleDC.argtypes = [wintypes.HDC]
+    _gdi32.CreateCompatibleDC.restype = wintypes.HDC
+    _gdi32.CreateCompatibleBitmap.argtypes = [wintypes.HDC, ctypes.c_int, ctypes.c_int]
+    _gdi32.CreateCompatibleBitmap.restype = wintypes.HBITMAP
+    _gdi32.SelectObject.argtypes = [wintypes.HDC, wintypes.HGDIOBJ]
+    _gdi32.SelectObject.restype = wintypes.HGDIOBJ
+    _gdi32.BitBlt.argtypes = [
+        wintypes.HDC,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        ctypes.c_int,
+        wintypes.HDC,
+        ctypes.c_int,
+        ctypes.c_int,
+        wintypes.DWORD,
+    ]
+    _gdi32.GetDIBits.argtypes = [
+        wintypes.HDC,
+        wintypes.HBITMAP,
+        wintypes.UINT,
+        wintypes.UINT,
+        ctypes.c_void_p,
+        ctypes.POINTER(BITMAPINFOHEADER),
+        wintypes.UINT,
+    ]
+    _gdi32.DeleteObject.argtypes = [wintypes.HGDIOBJ]
+    _gdi32.DeleteDC.argtypes = [wintypes.HDC]
+
+
+# GDI device contexts may not be shared between threads, so each capturing
+# thread (scanner, trigger pool, calibration worker) keeps its own pair for
+# its lifetime
+_local = threading.local()
+
+
+class _ThreadDCs:
+    """One thread's screen and memory DCs, released when the thread ends."""
+
+    __slots__ = ("mem_dc", "screen_dc")
+
+    def __init__(self, screen_dc: int, mem_dc: int):
+        self.screen_dc = screen_dc
+        self.mem_dc = mem_dc
+
+    def __del__(self) -> None:
+        # Runs when the owning thread exits and its thread-local is freed
+        _gdi32.DeleteDC(self.mem_dc)
+        _user32.ReleaseDC(None, self.screen_dc)
+
+
+def _thread_dcs() -> tuple[int, int]:
+    """Get this thread's (screen DC, memory DC), creating them on first use."""
+    dcs = getattr(_local, "dcs", None)
+    if dcs is None:
+        screen_dc = _user32.GetDC(None)
+        if not screen_dc:
+            msg = "GetDC failed"
+            raise OSError(msg)
+        mem_dc = _gdi32.CreateCompatibleDC(screen_dc)
+        if not mem_dc:
+            _user32.ReleaseDC(None, screen_dc)
+            msg = "CreateCompatibleDC failed"
+            raise OSError(msg)
+        dcs = _local.dcs = _ThreadDCs(screen_dc, mem_dc)
+    return dcs.screen_dc, dcs.mem_dc
+
+
+def grab_region(bbox: tuple[int, int, int, int]) -> Image.Image:
+    """
+    Capture the screen rectangle (left, top, right, bottom) as an RGB image.
+
+    Unlike ImageGrab.grab, which copies the whole screen and then crops,
+    this blits only the requested pixels. Raises OSError if the capture
+    fails, matching ImageGrab.
+    """
+    if _gdi32 is None:
+        return ImageGrab.grab(bbox=bbox)
+
+    left, top, right, bottom = bbox
+    width, height = right - left, bottom - top
+
+    screen_dc, mem_dc = _thread_dcs()
+    bitmap = _gdi32.CreateCompatibleBitmap(screen_dc, width, height)
+    previous = _gdi32.SelectObject(mem_dc, bitmap)
+    try:
+        if not _gdi32.BitBlt(
+            mem_dc, 0, 0, width, height, screen_dc, left, top, SRCCOPY
+        ):
+            msg = f"BitBlt failed for {bbox}"
+            raise OSError(msg)
+
+        # Negative height requests top-down rows, as PIL expects
+        header = BITMAPINFOHEADER(
+            biSize=ctypes.sizeof(BITMAPINFOHEADER),
+            biWidth=width,
+            biHeight=-height,
+            biPlanes=1,
+            biBitCount=32,
+            biCompression=BI_RGB,
+        )
+        buffer = ctypes.create_string_buffer(width * height * 4)
+        if not _gdi32.GetDIBits(
+            mem_dc, bitmap, 0, height, buffer, ctypes.byref(header), DIB_RGB_COLORS
+        ):
+            msg = f"GetDIBits failed for {bbox}"
+            raise OSError(msg)
+    finally:
+        _gdi32.SelectObject(mem_dc, previous)
+        _gdi32.DeleteObject(bitmap)
+
+    return Image.frombuffer("RGB", (width, height), buffer, "raw", "BGRX", 0, 1)
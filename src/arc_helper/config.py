@@ -4,12 +4,20 @@ Uses Pydantic Settings for type-safe configuration via environment variables.
 """
 
 import ctypes
+import logging
+import os
 import sys
+from collections.abc import Mapping
+from ctypes import wintypes
+from functools import cache
+from functools import lru_cache
 from pathlib import Path
 
-from dotenv import load_dotenv
+from dotenv import dotenv_values
 from pydantic import Field
 from pydantic_settings import BaseSettings
+from pydantic_settings import DotEnvSettingsSource
+from pydantic_settings import PydanticBaseSettingsSource
 from pydantic_settings import SettingsConfigDict
 
 from .logging_config import setup_logging
@@ -25,34 +33,68 @@ def get_app_dir() -> Path:
 
 
 APP_DIR = get_app_dir()
-
-
+ENV_PATH = APP_DIR / ".env"
+DEFAULT_DATABASE_PATH = APP_DIR / "items.db"
+DEFAULT_DEBUG_DIR = APP_DIR / "debug"
+
+
+LOGPIXELSX = 88
+SM_CXSCREEN = 0
+SM_CYSCREEN = 1
+
+try:
+    _user32 = ctypes.windll.user32
+    _gdi32 = ctypes.windll.gdi32
+except AttributeError:
+    # Not on Windows: display metrics are unavailable
+    _user32 = _gdi32 = None
+else:
+    # Bind signatures once so each call skips ctypes' argument guessing
+    _user32.SetProcessDPIAware.argtypes = []
+    _user32.SetProcessDPIAware.restype = wintypes.BOOL
+    _user32.GetSystemMetrics.argtypes = [ctypes.c_int]
+    _user32.GetSystemMetrics.restype = ctypes.c_int
+    _user32.GetDC.argtypes = [wintypes.HWND]
+    _user32.GetDC.restype = wintypes.HDC
+    _user32.ReleaseDC.argtypes = [wintypes.HWND, wintypes.HDC]
+    _user32.ReleaseDC.restype = ctypes.c_int
+    _gdi32.GetDeviceCaps.argtypes = [wintypes.HDC, ctypes.c_int]
+    _gdi32.GetDeviceCaps.restype = ctypes.c_int
+
+
+# Display metrics only change on display-configuration events, so they are
+# queried once; reload_settings() clears the caches.
+@lru_cache(maxsize=1)
 def get_screen_resolution() -> tuple[int, int]:
     """Get the primary monitor resolution in physical pixels."""
-    user32 = ctypes.windll.user32
-    user32.SetProcessDPIAware()  # This makes us get physical pixels
-    width = user32.GetSystemMetrics(0)
-    height = user32.GetSystemMetrics(1)
+    if _user32 is None:
+        msg = "Screen resolution is only available on Windows"
+        raise OSError(msg)
+    _user32.SetProcessDPIAware()  # This makes us get physical pixels
+    width = _user32.GetSystemMetrics(SM_CXSCREEN)
+    height = _user32.GetSystemMetrics(SM_CYSCREEN)
     return width, height
 
 
+@lru_cache(maxsize=1)
 def get_dpi_scale() -> float:
     """Get the current DPI scaling factor (e.g., 1.0, 1.5, 2.0, 3.0)."""
+    if _user32 is None:
+        return 1.0
     try:
-        # Get the DPI for the primary monitor
-        user32 = ctypes.windll.user32
-        user32.SetProcessDPIAware()
+        _user32.SetProcessDPIAware()
 
         # Get DC for the screen
-        hdc = user32.GetDC(0)
-        gdi32 = ctypes.windll.gdi32
+        hdc = _user32.GetDC(None)
+        if not hdc:
+            return 1.0
 
-        # LOGPIXELSX = 88, standard DPI is 96
-        dpi = gdi32.GetDeviceCaps(hdc, 88)
-        user32.ReleaseDC(0, hdc)
+        # Standard DPI is 96
+        dpi = _gdi32.GetDeviceCaps(hdc, LOGPIXELSX)
+        _user32.ReleaseDC(None, hdc)
 
         return dpi / 96.0
-    except (AttributeError, OSError):
+    except OSError:
         return 1.0
 
 
@@ -69,29 +111,73 @@ def unscale_from_dpi(value: int) -> int:
     return int(value / scale)
 
 
+# Bundled copy first, then the standard installer locations. Probed once per
+# process; reloads reuse the answer.
+_TESSERACT_CANDIDATES = (
+    os.fspath(APP_DIR / "tesseract" / "tesseract.exe"),
+    r"C:\Program Files\Tesseract-OCR\tesseract.exe",
+    r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe",
+)
+
+
+@cache
 def get_tesseract_path() -> str | None:
     """Find Tesseract executable - checks bundled location first."""
-    # Check for bundled Tesseract
-    bundled = APP_DIR / "tesseract" / "tesseract.exe"
-    if bundled.exists():
-        return str(bundled)
-
-    # Check common installation paths
-    common_paths = [
-        Path(r"C:\Program Files\Tesseract-OCR\tesseract.exe"),
-        Path(r"C:\Program Files (x86)\Tesseract-OCR\tesseract.exe"),
-    ]
-    for path in common_paths:
-        if path.exists():
-            return str(path)
+    for path in _TESSERACT_CANDIDATES:
+        if os.path.isfile(path):  # noqa: PTH113
+            return path
 
     # Return None - will use system PATH
     return None
 
 
+@lru_cache(maxsize=8)
+def parse_env_file(path: Path, _mtime_ns: int) -> dict[str, str | None]:
+    """Parse a .env file; cached until the file's mtime changes."""
+    return dotenv_values(path, encoding="utf-8")
+
+
+class _CachedDotEnvSource(DotEnvSettingsSource):
+    """Dotenv source sharing one parse of each .env file across all models."""
+
+    def _read_env_file(self, file_path: Path) -> Mapping[str, str | None]:
+        values = parse_env_file(file_path, file_path.stat().st_mtime_ns)
+        if self.case_sensitive:
+            return values
+        return {key.lower(): value for key, value in values.items()}
+
+
+class _EnvFileSettings(BaseSettings):
+    """
+    Base for settings models that read APP_DIR/.env.
+
+    Settings() builds seven nested models, each with its own env_file; the
+    cached source makes them share a single read of the file.
+    """
+
+    @classmethod
+    def settings_customise_sources(
+        cls,
+        settings_cls: type[BaseSettings],
+        init_settings: PydanticBaseSettingsSource,
+        env_settings: PydanticBaseSettingsSource,
+        dotenv_settings: PydanticBaseSettingsSource,
+        file_secret_settings: PydanticBaseSettingsSource,
+    ) -> tuple[PydanticBaseSettingsSource, ...]:
+        cached_dotenv = _CachedDotEnvSource(
+            settings_cls,
+            env_file=dotenv_settings.env_file,
+            env_file_encoding=dotenv_settings.env_file_encoding,
+        )
+        return init_settings, env_settings, cached_dotenv, file_secret_settings
+
+
 class RegionMixin:
     """Mixin that adds bbox property to region classes."""
 
+    # No instance state of its own, so slotted subclasses stay dict-free
+    __slots__ = ()
+
     x: int
     y: int
     width: int
@@ -103,12 +189,12 @@ class RegionMixin:
         return (self.x, self.y, self.x + self.width, self.y + self.height)
 
 
-class TriggerRegion(RegionMixin, BaseSettings):
+class TriggerRegion(RegionMixin, _EnvFileSettings):
     """Region where INVENTORY text appears - menu mode."""
 
     model_config = SettingsConfigDict(
         env_prefix="TRIGGER_REGION_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -119,12 +205,12 @@ class TriggerRegion(RegionMixin, BaseSettings):
     height: int = Field(default=1, description="Height of trigger region")
 
 
-class TriggerRegion2(RegionMixin, BaseSettings):
+class TriggerRegion2(RegionMixin, _EnvFileSettings):
     """Region where INVENTORY text appears - in-raid mode."""
 
     model_config = SettingsConfigDict(
         env_prefix="TRIGGER_REGION2_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -135,12 +221,12 @@ class TriggerRegion2(RegionMixin, BaseSettings):
     height: int = Field(default=1, description="Height of trigger region")
 
 
-class TooltipRegion(RegionMixin, BaseSettings):
+class TooltipRegion(RegionMixin, _EnvFileSettings):
     """Region where item name appears in tooltip - used for calibration only."""
 
     model_config = SettingsConfigDict(
         env_prefix="TOOLTIP_REGION_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -151,12 +237,12 @@ class TooltipRegion(RegionMixin, BaseSettings):
     height: int = Field(default=1, description="Height of trigger region")
 
 
-class TooltipCaptureSettings(BaseSettings):
+class TooltipCaptureSettings(_EnvFileSettings):
     """Settings for cursor-relative tooltip capture."""
 
     model_config = SettingsConfigDict(
         env_prefix="TOOLTIP_CAPTURE_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -167,12 +253,12 @@ class TooltipCaptureSettings(BaseSettings):
     offset_y: int = Field(default=0, description="Y offset from cursor")
 
 
-class OverlaySettings(BaseSettings):
+class OverlaySettings(_EnvFileSettings):
     """Settings for the overlay window."""
 
     model_config = SettingsConfigDict(
         env_prefix="OVERLAY_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -185,12 +271,12 @@ class OverlaySettings(BaseSettings):
     cooldown: float = Field(default=2.0, description="Minimum time between same item")
 
 
-class ScanSettings(BaseSettings):
+class ScanSettings(_EnvFileSettings):
     """Settings for scanning intervals."""
 
     model_config = SettingsConfigDict(
         env_prefix="",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -201,14 +287,19 @@ class ScanSettings(BaseSettings):
     tooltip_scan_interval: float = Field(
         default=0.3, description="Seconds between tooltip scans"
     )
+    trigger_check_stride: int = Field(
+        default=3,
+        ge=1,
+        description="Tooltip scans between trigger re-checks while inventory is open",
+    )
 
 
-class StationLevelSettings(BaseSettings):
+class StationLevelSettings(_EnvFileSettings):
     """User-configured crafting station levels."""
 
     model_config = SettingsConfigDict(
         env_prefix="STATION_",
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -228,11 +319,75 @@ class StationLevelSettings(BaseSettings):
     scrappy: int = Field(default=0, ge=0, le=5, description="Scrappy level (0-5)")
 
 
-class Settings(BaseSettings):
+_ENV_TEMPLATE = """\
+# Arc Raiders Helper Configuration
+# =================================
+
+# Trigger region 1 - Menu mode
+TRIGGER_REGION_X={TRIGGER_REGION_X}
+TRIGGER_REGION_Y={TRIGGER_REGION_Y}
+TRIGGER_REGION_WIDTH={TRIGGER_REGION_WIDTH}
+TRIGGER_REGION_HEIGHT={TRIGGER_REGION_HEIGHT}
+
+# Trigger region 2 - In-raid mode
+TRIGGER_REGION2_X={TRIGGER_REGION2_X}
+TRIGGER_REGION2_Y={TRIGGER_REGION2_Y}
+TRIGGER_REGION2_WIDTH={TRIGGER_REGION2_WIDTH}
+TRIGGER_REGION2_HEIGHT={TRIGGER_REGION2_HEIGHT}
+
+# Tooltip capture
+TOOLTIP_CAPTURE_WIDTH={TOOLTIP_CAPTURE_WIDTH}
+TOOLTIP_CAPTURE_HEIGHT={TOOLTIP_CAPTURE_HEIGHT}
+TOOLTIP_CAPTURE_OFFSET_X={TOOLTIP_CAPTURE_OFFSET_X}
+TOOLTIP_CAPTURE_OFFSET_Y={TOOLTIP_CAPTURE_OFFSET_Y}
+
+# Tooltip region (legacy)
+TOOLTIP_REGION_X={TOOLTIP_REGION_X}
+TOOLTIP_REGION_Y={TOOLTIP_REGION_Y}
+TOOLTIP_REGION_WIDTH={TOOLTIP_REGION_WIDTH}
+TOOLTIP_REGION_HEIGHT={TOOLTIP_REGION_HEIGHT}
+
+# Overlay settings
+OVERLAY_X={OVERLAY_X}
+OVERLAY_Y={OVERLAY_Y}
+OVERLAY_DISPLAY_TIME={OVERLAY_DISPLAY_TIME}
+OVERLAY_COOLDOWN={OVERLAY_COOLDOWN}
+
+# Scan intervals
+TRIGGER_SCAN_INTERVAL={TRIGGER_SCAN_INTERVAL}
+TOOLTIP_SCAN_INTERVAL={TOOLTIP_SCAN_INTERVAL}
+TRIGGER_CHECK_STRIDE={TRIGGER_CHECK_STRIDE}
+
+# Debug settings
+DEBUG_MODE={DEBUG_MODE}
+SHOW_CAPTURE_AREA={SHOW_CAPTURE_AREA}
+
+# Station levels (0 = not built, max varies by station)
+STATION_GEAR_BENCH={STATION_GEAR_BENCH}
+STATION_GUNSMITH={STATION_GUNSMITH}
+STATION_MEDICAL_LAB={STATION_MEDICAL_LAB}
+STATION_EXPLOSIVES_STATION={STATION_EXPLOSIVES_STATION}
+STATION_UTILITY_STATION={STATION_UTILITY_STATION}
+STATION_REFINER={STATION_REFINER}
+STATION_SCRAPPY={STATION_SCRAPPY}
+
+# Paths (auto-detected unless set here)
+"""
+
+# Path fields are only written back when explicitly configured; auto-detected
+# values stay unset so a moved install or Tesseract is found again
+_PATH_OVERRIDES = {
+    "tesseract_path": "TESSERACT_PATH",
+    "database_path": "DATABASE_PATH",
+    "debug_output_dir": "DEBUG_OUTPUT_DIR",
+}
+
+
+class Settings(_EnvFileSettings):
     """Main application settings."""
 
     model_config = SettingsConfigDict(
-        env_file=APP_DIR / ".env",
+        env_file=ENV_PATH,
         env_file_encoding="utf-8",
         extra="ignore",
     )
@@ -252,11 +407,11 @@ class Settings(BaseSettings):
     tesseract_path: str | None = Field(default_factory=get_tesseract_path)
 
     # Database in app directory
-    database_path: Path = Field(default_factory=lambda: APP_DIR / "items.db")
+    database_path: Path = DEFAULT_DATABASE_PATH
 
     # Debug settings
     debug_mode: bool = Field(default=False, description="Enable debug mode")
-    debug_output_dir: Path = Field(default_factory=lambda: APP_DIR / "debug")
+    debug_output_dir: Path = DEFAULT_DEBUG_DIR
     show_capture_area: bool = Field(
         default=False, description="Show red overlay for capture area"
     )
@@ -264,66 +419,67 @@ class Settings(BaseSettings):
     def save_to_env(self, env_path: Path | None = None) -> None:
         """Save current settings to .env file."""
         if env_path is None:
-            env_path = APP_DIR / ".env"
-
-        lines = [
-            "# Arc Raiders Helper Configuration",
-            "# =================================",
-            "",
-            "# Trigger region 1 - Menu mode",
-            f"TRIGGER_REGION_X={self.trigger_region.x}",
-            f"TRIGGER_REGION_Y={self.trigger_region.y}",
-            f"TRIGGER_REGION_WIDTH={self.trigger_region.width}",
-            f"TRIGGER_REGION_HEIGHT={self.trigger_region.height}",
-            "",
-            "# Trigger region 2 - In-raid mode",
-            f"TRIGGER_REGION2_X={self.trigger_region2.x}",
-            f"TRIGGER_REGION2_Y={self.trigger_region2.y}",
-            f"TRIGGER_REGION2_WIDTH={self.trigger_region2.width}",
-            f"TRIGGER_REGION2_HEIGHT={self.trigger_region2.height}",
-            "",
-            "# Tooltip capture",
-            f"TOOLTIP_CAPTURE_WIDTH={self.tooltip_capture.width}",
-            f"TOOLTIP_CAPTURE_HEIGHT={self.tooltip_capture.height}",
-            f"TOOLTIP_CAPTURE_OFFSET_X={self.tooltip_capture.offset_x}",
-            f"TOOLTIP_CAPTURE_OFFSET_Y={self.tooltip_capture.offset_y}",
-            "",
-            "# Overlay settings",
-            f"OVERLAY_X={self.overlay.x}",
-            f"OVERLAY_Y={self.overlay.y}",
-            f"OVERLAY_DISPLAY_TIME={self.overlay.display_time}",
-            f"OVERLAY_COOLDOWN={self.overlay.cooldown}",
-            "",
-            "# Scan intervals",
-            f"TRIGGER_SCAN_INTERVAL={self.scan.trigger_scan_interval}",
-            f"TOOLTIP_SCAN_INTERVAL={self.scan.tooltip_scan_interval}",
-            "",
-            "# Debug settings",
-            f"DEBUG_MODE={str(self.debug_mode).lower()}",
-            f"SHOW_CAPTURE_AREA={str(self.show_capture_area).lower()}",
-            "",
-            "# Station levels (0 = not built, max varies by station)",
-            f"STATION_GEAR_BENCH={self.stations.gear_bench}",
-            f"STATION_GUNSMITH={self.stations.gunsmith}",
-            f"STATION_MEDICAL_LAB={self.stations.medical_lab}",
-            f"STATION_EXPLOSIVES_STATION={self.stations.explosives_station}",
-            f"STATION_UTILITY_STATION={self.stations.utility_station}",
-            f"STATION_REFINER={self.stations.refiner}",
-            f"STATION_SCRAPPY={self.stations.scrappy}",
-        ]
-
-        with Path(env_path).open("w", encoding="utf-8") as f:
-            f.write("\n".join(lines))
-            f.flush()  # Add this line
-
-        # Add this line - reload dotenv to pick up new values
-        load_dotenv(env_path, override=True)
+            env_path = ENV_PATH
+
+        values = {
+            "TRIGGER_REGION_X": self.trigger_region.x,
+            "TRIGGER_REGION_Y": self.trigger_region.y,
+            "TRIGGER_REGION_WIDTH": self.trigger_region.width,
+            "TRIGGER_REGION_HEIGHT": self.trigger_region.height,
+            "TRIGGER_REGION2_X": self.trigger_region2.x,
+            "TRIGGER_REGION2_Y": self.trigger_region2.y,
+            "TRIGGER_REGION2_WIDTH": self.trigger_region2.width,
+            "TRIGGER_REGION2_HEIGHT": self.trigger_region2.height,
+            "TOOLTIP_CAPTURE_WIDTH": self.tooltip_capture.width,
+            "TOOLTIP_CAPTURE_HEIGHT": self.tooltip_capture.height,
+            "TOOLTIP_CAPTURE_OFFSET_X": self.tooltip_capture.offset_x,
+            "TOOLTIP_CAPTURE_OFFSET_Y": self.tooltip_capture.offset_y,
+            "TOOLTIP_REGION_X": self.tooltip_region.x,
+            "TOOLTIP_REGION_Y": self.tooltip_region.y,
+            "TOOLTIP_REGION_WIDTH": self.tooltip_region.width,
+            "TOOLTIP_REGION_HEIGHT": self.tooltip_region.height,
+            "OVERLAY_X": self.overlay.x,
+            "OVERLAY_Y": self.overlay.y,
+            "OVERLAY_DISPLAY_TIME": self.overlay.display_time,
+            "OVERLAY_COOLDOWN": self.overlay.cooldown,
+            "TRIGGER_SCAN_INTERVAL": self.scan.trigger_scan_interval,
+            "TOOLTIP_SCAN_INTERVAL": self.scan.tooltip_scan_interval,
+            "TRIGGER_CHECK_STRIDE": self.scan.trigger_check_stride,
+            "DEBUG_MODE": str(self.debug_mode).lower(),
+            "SHOW_CAPTURE_AREA": str(self.show_capture_area).lower(),
+            "STATION_GEAR_BENCH": self.stations.gear_bench,
+            "STATION_GUNSMITH": self.stations.gunsmith,
+            "STATION_MEDICAL_LAB": self.stations.medical_lab,
+            "STATION_EXPLOSIVES_STATION": self.stations.explosives_station,
+            "STATION_UTILITY_STATION": self.stations.utility_station,
+            "STATION_REFINER": self.stations.refiner,
+            "STATION_SCRAPPY": self.stations.scrappy,
+        }
+
+        overrides = {
+            key: getattr(self, field)
+            for field, key in _PATH_OVERRIDES.items()
+            if field in self.model_fields_set and getattr(self, field) is not None
+        }
+        text = _ENV_TEMPLATE.format_map(values) + "".join(
+            f"{key}={value}\n" for key, value in overrides.items()
+        )
+        values.update(overrides)
+
+        Path(env_path).write_text(text, encoding="utf-8")
+
+        # Environment variables outrank .env, so mirror the saved values there
+        # directly instead of re-reading the file we just wrote
+        os.environ.update({key: str(value) for key, value in values.items()})
 
 
 class SettingsManager:
     """Manages the singleton Settings instance."""
 
     _instance: Settings | None = None
+    # Bumped whenever settings are reloaded so long-running loops can
+    # cheaply detect that their cached values are stale
+    _version: int = 0
 
     @classmethod
     def get(cls) -> Settings:
@@ -334,11 +490,26 @@ class SettingsManager:
     @classmethod
     def reload(cls) -> Settings:
         cls._instance = Settings()
+        cls._version += 1
+        get_screen_resolution.cache_clear()
+        get_dpi_scale.cache_clear()
         return cls._instance
 
+    @classmethod
+    def replace(cls, settings: Settings) -> Settings:
+        """Install an already built Settings, e.g. one just saved to .env."""
+        cls._instance = settings
+        cls._version += 1
+        return settings
+
     @classmethod
     def reset(cls) -> None:
         cls._instance = None
+        cls._version += 1
+
+    @classmethod
+    def version(cls) -> int:
+        return cls._version
 
 
 def get_settings() -> Settings:
@@ -350,8 +521,15 @@ def reload_settings() -> Settings:
 
 
 # =============================================================================
-# Initialize logging once when this module is imported
+# Logging
 # =============================================================================
 
-_initial_settings = Settings()  # Load settings to get debug_mode
-logger = setup_logging(APP_DIR, debug_mode=_initial_settings.debug_mode)
+# Handlers are installed by get_logger() at startup, not on import, so
+# importing config (tests, tooling) opens no files or threads
+logger = logging.getLogger("arc_helper")
+
+
+@cache
+def get_logger() -> logging.Logger:
+    """Configure logging on first call and return the application logger."""
+    return setup_logging(APP_DIR, debug_mode=get_settings().debug_mode)
@@ -6,6 +6,9 @@ SQLite operations for item recommendations with Pydantic models.
 import csv
 import difflib
 import sqlite3
+import threading
+from collections import deque
+from collections.abc import Iterator
 from pathlib import Path
 
 from pydantic import BaseModel
@@ -24,6 +27,20 @@ class Item(BaseModel):
     sell_price: str | None = Field(default=None, max_length=50)
 
 
+# CSV columns in _UPSERT_SQL parameter order; only name and action are required
+_CSV_COLUMNS = ("name", "action", "recycle_for", "keep_for", "sell_price")
+
+_UPSERT_SQL = """
+    INSERT INTO items (name, action, recycle_for, keep_for, sell_price)
+    VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT(name) DO UPDATE SET
+        action = excluded.action,
+        recycle_for = excluded.recycle_for,
+        keep_for = excluded.keep_for,
+        sell_price = excluded.sell_price
+"""
+
+
 class Database:
     """SQLite database handler for items."""
 
@@ -32,17 +49,37 @@ class Database:
         if db_path is None:
             db_path = get_settings().database_path
         self.db_path = db_path
+
+        # One connection for the lifetime of the handler, shared by the
+        # scanner thread and the UI thread; the lock serializes access
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._lock = threading.RLock()
         self._init_db()
 
-    def _get_connection(self) -> sqlite3.Connection:
-        """Get a database connection."""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        return conn
+        # Whole table in memory keyed by lowercased name, built on the first
+        # lookup and rebuilt whenever data_version() moves on
+        self._items: dict[str, Item] | None = None
+        self._items_version: tuple[int, int] | None = None
+        # Commits made through this handler, which SQLite's data_version
+        # does not count
+        self._writes = 0
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
 
     def _init_db(self) -> None:
         """Initialize database schema."""
-        with self._get_connection() as conn:
+        with self._lock:
+            conn = self._conn
+            # WAL lets the scanner read while the calibration tool writes, and
+            # with synchronous=NORMAL commits no longer fsync every time.
+            # In-memory databases silently keep their own journal mode.
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA temp_store=MEMORY")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS items (
                     name TEXT PRIMARY KEY NOT NULL COLLATE NOCASE,
@@ -63,56 +100,61 @@ class Database:
                 conn.execute("ALTER TABLE items ADD COLUMN sell_price TEXT")
             conn.commit()
 
-    def lookup(self, name: str) -> Item | None:
-        """Look up an item by name (case-insensitive, with fuzzy matching)."""
-        clean_name = name.strip()
-
-        with self._get_connection() as conn:
-            # First try exact match
-            cursor = conn.execute(
-                "SELECT * FROM items WHERE name = ? COLLATE NOCASE",
-                (clean_name,),
-            )
-            row = cursor.fetchone()
-
-            # If no exact match, try LIKE match
-            if not row:
-                cursor = conn.execute(
-                    """
-                    SELECT * FROM items
-                    WHERE name LIKE ? COLLATE NOCASE
-                    ORDER BY LENGTH(name) ASC
-                    LIMIT 1
-                    """,
-                    (f"%{clean_name}%",),
-                )
-                row = cursor.fetchone()
-
-            # If still no match, try fuzzy matching (handles OCR typos)
-            if not row:
-                cursor = conn.execute("SELECT name FROM items")
-                all_names = [r[0] for r in cursor.fetchall()]
+    def data_version(self) -> tuple[int, int]:
+        """
+        Get a marker that changes whenever the items table may have changed.
 
-                # Find closest match with at least 80% similarity
-                matches = difflib.get_close_matches(
-                    clean_name, all_names, n=1, cutoff=0.8
+        Combines SQLite's data_version, which moves on when another
+        connection (e.g. the calibration tool) commits, with the count of
+        this handler's own writes.
+        """
+        with self._lock:
+            external = self._conn.execute("PRAGMA data_version").fetchone()[0]
+            return external, self._writes
+
+    def _item_index(self) -> dict[str, Item]:
+        """Get all items keyed by lowercased name, reloading them if stale."""
+        with self._lock:
+            version = self.data_version()
+            if self._items is None or version != self._items_version:
+                cursor = self._conn.execute(
+                    "SELECT name, action, recycle_for, keep_for, sell_price "
+                    "FROM items ORDER BY name"
                 )
+                self._items = {
+                    row["name"].lower(): self._row_to_item(row)
+                    for row in cursor.fetchall()
+                }
+                self._items_version = version
+            return self._items
 
-                if matches:
-                    match_name = matches[0]
-                    cursor = conn.execute(
-                        "SELECT * FROM items WHERE name = ?", (match_name,)
-                    )
-                    row = cursor.fetchone()
-
-            if row:
-                return self._row_to_item(row)
-            return None
+    def lookup(self, name: str) -> Item | None:
+        """Look up an item by name (case-insensitive, with fuzzy matching)."""
+        clean_name = name.strip()
+        key = clean_name.lower()
+        items = self._item_index()
+
+        # First try exact match
+        item = items.get(key)
+        if item is not None:
+            return item
+
+        # If no exact match, take the shortest name containing the query
+        containing = [other for other in items if key in other]
+        if containing:
+            return items[min(containing, key=len)]
+
+        # If still no match, try fuzzy matching (handles OCR typos)
+        by_name = {item.name: item for item in items.values()}
+        matches = difflib.get_close_matches(clean_name, by_name, n=1, cutoff=0.8)
+        if matches:
+            return by_name[matches[0]]
+        return None
 
     def count(self) -> int:
         """Get total item count."""
-        with self._get_connection() as conn:
-            cursor = conn.execute("SELECT COUNT(*) FROM items")
+        with self._lock:
+            cursor = self._conn.execute("SELECT COUNT(*) FROM items")
             return cursor.fetchone()[0]
 
     def load_csv(self, csv_path: Path | str, *, clear_existing: bool = True) -> int:
@@ -129,46 +171,75 @@ class Database:
         Returns:
             Number of items loaded
         """
+        # Drain the batched loader, keeping only its final progress report
+        last = deque(
+            self.iter_load_csv(csv_path, clear_existing=clear_existing), maxlen=1
+        )
+        return last[0][2] if last else 0
+
+    def iter_load_csv(
+        self,
+        csv_path: Path | str,
+        *,
+        clear_existing: bool = True,
+        batch_size: int = 200,
+    ) -> Iterator[tuple[int, int, int]]:
+        """
+        Load items from a CSV file in batches, yielding progress.
+
+        Same as load_csv, but yields (rows_processed, total_rows, items_loaded)
+        after each batch so UI callers can stay responsive. Rows are only
+        parsed between yields; the database is written in one transaction
+        before the final report, so other callers never see a partial load.
+        """
         csv_path = Path(csv_path)
         if not csv_path.exists():
             msg = f"CSV file not found: {csv_path}"
             raise FileNotFoundError(msg)
 
-        if clear_existing:
-            self.clear()
-
-        count = 0
-        with self._get_connection() as conn:
-            with Path(csv_path).open(encoding="utf-8") as f:
-                reader = csv.DictReader(f)
-
-                for row in reader:
-                    name = row.get("name", "").strip()
-                    action = row.get("action", "").strip()
-                    recycle_for = row.get("recycle_for", "").strip() or None
-                    keep_for = row.get("keep_for", "").strip() or None
-                    sell_price = row.get("sell_price", "").strip() or None
-
-                    if not name or not action:
-                        continue
-
-                    conn.execute(
-                        """
-                        INSERT INTO items (name, action, recycle_for, keep_for, sell_price)
-                        VALUES (?, ?, ?, ?, ?)
-                        ON CONFLICT(name) DO UPDATE SET
-                            action = excluded.action,
-                            recycle_for = excluded.recycle_for,
-                            keep_for = excluded.keep_for,
-                            sell_price = excluded.sell_price
-                        """,
-                        (name, action, recycle_for, keep_for, sell_price),
-                    )
-                    count += 1
+        with csv_path.open(encoding="utf-8") as f:
+            reader = csv.reader(f)
+            header = next(reader, [])
+            columns = tuple(
+                header.index(column) if column in header else None
+                for column in _CSV_COLUMNS
+            )
+            # Like DictReader, skip blank lines
+            rows = [row for row in reader if row]
+
+        total = len(rows)
+        values: list[tuple[str | None, ...]] = []
+        for start in range(0, total, batch_size):
+            values.extend(
+                row_values
+                for row in rows[start : start + batch_size]
+                if (row_values := self._csv_row_values(row, columns)) is not None
+            )
+            if start + batch_size < total:
+                yield start + batch_size, total, len(values)
 
-            conn.commit()
+        # The lock and transaction are held only for the write, never across
+        # a yield, so nothing can interleave with (or commit) a partial table
+        with self._lock, self._conn as conn:
+            if clear_existing:
+                conn.execute("DELETE FROM items")
+            conn.executemany(_UPSERT_SQL, values)
+            self._writes += 1
 
-        return count
+        yield total, total, len(values)
+
+    @staticmethod
+    def _csv_row_values(
+        row: list[str], columns: tuple[int | None, ...]
+    ) -> tuple[str | None, ...] | None:
+        """Clean one CSV row into upsert parameters; None if it is incomplete."""
+        name, action, recycle_for, keep_for, sell_price = (
+            row[i].strip() if i is not None and i < len(row) else "" for i in columns
+        )
+        if not name or not action:
+            return None
+
+        return name, action, recycle_for or None, keep_for or None, sell_price or None
 
     def log_missing_item(self, name: str) -> None:
         """Log an unknown item to missing_items.csv for easy addition later."""
@@ -198,18 +269,27 @@ class Database:
 
     def get_all_items(self) -> list[Item]:
         """Get all items from the database."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.execute(
+        with self._lock:
+            cursor = self._conn.execute(
                 "SELECT name, action, recycle_for, keep_for, sell_price FROM items ORDER BY name"
             )
             return [self._row_to_item(row) for row in cursor.fetchall()]
 
+    def get_items(self, offset: int, limit: int) -> list[Item]:
+        """Get one page of items, ordered by name like get_all_items."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT name, action, recycle_for, keep_for, sell_price FROM items "
+                "ORDER BY name LIMIT ? OFFSET ?",
+                (limit, offset),
+            )
+            return [self._row_to_item(row) for row in cursor.fetchall()]
+
     def clear(self) -> None:
         """Delete all items from the database."""
-        with sqlite3.connect(self.db_path) as conn:
+        with self._lock, self._conn as conn:
             conn.execute("DELETE FROM items")
-            conn.commit()
+            self._writes += 1
 
 
 def get_database() -> Database:
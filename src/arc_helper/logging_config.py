@@ -2,8 +2,12 @@
 Logging configuration for Arc Raiders Helper.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler
+from logging.handlers import QueueListener
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
@@ -12,6 +16,9 @@ def setup_logging(app_dir: Path, *, debug_mode: bool = False) -> logging.Logger:
     """
     Configure and return the application logger.
 
+    Records are handed to a background listener thread through a queue, so
+    the scanner thread never blocks on console or file I/O.
+
     Call this once at application startup.
     """
     logger = logging.getLogger("arc_helper")
@@ -24,20 +31,30 @@ def setup_logging(app_dir: Path, *, debug_mode: bool = False) -> logging.Logger:
     if logger.handlers:
         return logger
 
-    # Console handler
-    console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setLevel(logging.DEBUG)
-    console_format = logging.Formatter(
-        "%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
-    )
-    console_handler.setFormatter(console_format)
-    logger.addHandler(console_handler)
+    # Our handlers cover everything; don't also format records for the root
+    logger.propagate = False
+
+    handlers: list[logging.Handler] = []
+
+    # Console handler, skipped in windowed builds where there is no stdout
+    if sys.stdout is not None:
+        console_handler = logging.StreamHandler(sys.stdout)
+        console_handler.setLevel(logging.DEBUG)
+        console_format = logging.Formatter(
+            "%(asctime)s [%(levelname)s] %(message)s", datefmt="%H:%M:%S"
+        )
+        console_handler.setFormatter(console_format)
+        handlers.append(console_handler)
 
     # File handler (only in debug mode)
     if debug_mode:
         log_file = app_dir / "arc_helper.log"
         file_handler = RotatingFileHandler(
-            log_file, maxBytes=5 * 1024 * 1024, backupCount=2, encoding="utf-8"
+            log_file,
+            maxBytes=5 * 1024 * 1024,
+            backupCount=2,
+            encoding="utf-8",
+            delay=True,
         )
         file_handler.setLevel(logging.DEBUG)
         file_format = logging.Formatter(
@@ -45,6 +62,13 @@ def setup_logging(app_dir: Path, *, debug_mode: bool = False) -> logging.Logger:
             datefmt="%Y-%m-%d %H:%M:%S",
         )
         file_handler.setFormatter(file_format)
-        logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Hand records off to a background thread that does the actual writing
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
 
     return logger
@@ -3,38 +3,54 @@ Arc Raiders Helper - Main Application.
 Coordinates OCR scanning and overlay display.
 """
 
+from __future__ import annotations
+
 # Enable windows DPI scaling
 import ctypes
+import os
+import queue
 import sys
 import threading
 import time
-import tkinter as tk
 import traceback
 from contextlib import suppress
 from dataclasses import dataclass
 from dataclasses import field
 from enum import Enum
 from enum import auto
+from functools import cache
+from functools import lru_cache
 from pathlib import Path
 from threading import Thread
+from typing import TYPE_CHECKING
+from typing import NamedTuple
 
 from dotenv import load_dotenv
 
 from arc_helper.config import APP_DIR
+from arc_helper.config import RegionMixin
+from arc_helper.config import Settings
 from arc_helper.config import SettingsManager
+from arc_helper.config import get_logger
 from arc_helper.config import get_settings
 from arc_helper.config import logger
 from arc_helper.database import Database
 from arc_helper.database import Item
 from arc_helper.database import get_database
 from arc_helper.ocr import OCREngineManager
+from arc_helper.ocr import get_cursor_position
 from arc_helper.ocr import get_ocr_engine
-from arc_helper.overlay import OverlayWindow
-from arc_helper.overlay import StatusWindow
 from arc_helper.resolution_profiles import get_profile_manager
 from arc_helper.stations import get_station_levels
 from arc_helper.stations import resolve_action
 
+if TYPE_CHECKING:
+    import tkinter as tk
+    from collections.abc import Callable
+
+    from arc_helper.overlay import OverlayWindow
+    from arc_helper.overlay import StatusWindow
+
 try:
     # Windows 10 1607+ (most reliable)
     ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
@@ -43,7 +59,18 @@ except (AttributeError, OSError):
         # Fallback for older Windows
         ctypes.windll.user32.SetProcessDPIAware()
 
-load_dotenv(Path(__file__).with_name(".env"), override=False)
+# Set once the package .env has been loaded; inherited by child processes
+_ENV_LOADED_MARKER = "ARC_HELPER_ENV_LOADED"
+
+
+@cache
+def _load_env_once() -> None:
+    """Load the package .env into the environment, at most once per process."""
+    # Frozen builds started from another instance inherit an already loaded env
+    if getattr(sys, "frozen", False) and _ENV_LOADED_MARKER in os.environ:
+        return
+    load_dotenv(Path(__file__).with_name(".env"), override=False)
+    os.environ[_ENV_LOADED_MARKER] = "1"
 
 
 class ScannerState(Enum):
@@ -55,12 +82,60 @@ class ScannerState(Enum):
     STOPPED = auto()  # Fully stopped
 
 
+class ScanSnapshot(NamedTuple):
+    """
+    Plain snapshot of the settings read on every scan or overlay tick.
+
+    Taken once per settings load so hot loops read tuple fields instead of
+    walking the nested pydantic settings models.
+    """
+
+    trigger_regions: tuple[RegionMixin, ...]
+    trigger_interval: float
+    tooltip_interval: float
+    trigger_stride: int
+    cooldown: float
+    tooltip_width: int
+    tooltip_height: int
+    tooltip_offset_x: int
+    tooltip_offset_y: int
+
+    @classmethod
+    def from_settings(cls, settings: Settings) -> ScanSnapshot:
+        return cls(
+            trigger_regions=(settings.trigger_region, settings.trigger_region2),
+            trigger_interval=settings.scan.trigger_scan_interval,
+            tooltip_interval=settings.scan.tooltip_scan_interval,
+            trigger_stride=settings.scan.trigger_check_stride,
+            cooldown=settings.overlay.cooldown,
+            tooltip_width=settings.tooltip_capture.width,
+            tooltip_height=settings.tooltip_capture.height,
+            tooltip_offset_x=settings.tooltip_capture.offset_x,
+            tooltip_offset_y=settings.tooltip_capture.offset_y,
+        )
+
+
 class DebugOverlay:
     """Semi-transparent overlay showing the tooltip capture area."""
 
-    def __init__(self, root: tk.Tk, settings):
+    # Follow the cursor at ~60 Hz while it moves; poll slowly once it rests
+    ACTIVE_POLL_MS = 16
+    IDLE_POLL_MS = 200
+    IDLE_AFTER_MS = 500
+
+    def __init__(self, root: tk.Tk, snapshot: ScanSnapshot):
+        import tkinter as tk
+
         self.root = root
-        self.settings = settings
+
+        # Capture area is fixed for the lifetime of the overlay
+        self._offset_x = snapshot.tooltip_offset_x
+        self._offset_y = snapshot.tooltip_offset_y
+        self._geometry_fmt = (
+            f"{snapshot.tooltip_width}x{snapshot.tooltip_height}+{{x}}+{{y}}"
+        )
+        self._last_position: tuple[int, int] | None = None
+        self._idle_ms = 0
 
         self.window = tk.Toplevel(root)
         self.window.title("Capture Area")
@@ -75,21 +150,24 @@ class DebugOverlay:
     def _update_position(self):
         """Update overlay position to follow cursor."""
         try:
-            from src.arc_helper.ocr import get_cursor_position
-
             cursor = get_cursor_position()
-
-            x = cursor.x + self.settings.tooltip_capture.offset_x
-            y = cursor.y + self.settings.tooltip_capture.offset_y
-            w = self.settings.tooltip_capture.width
-            h = self.settings.tooltip_capture.height
-
-            self.window.geometry(f"{w}x{h}+{x}+{y}")
+            position = (cursor.x + self._offset_x, cursor.y + self._offset_y)
+
+            # Skip the Tk round-trip when the cursor hasn't moved
+            if position != self._last_position:
+                x, y = position
+                self.window.geometry(self._geometry_fmt.format(x=x, y=y))
+                self._last_position = position
+                self._idle_ms = 0
         except Exception:  # noqa: BLE001
             pass
 
-        # Schedule next update (every 50ms for smooth following)
-        self.root.after(50, self._update_position)
+        if self._idle_ms >= self.IDLE_AFTER_MS:
+            delay = self.IDLE_POLL_MS
+        else:
+            delay = self.ACTIVE_POLL_MS
+        self._idle_ms += delay
+        self.root.after(delay, self._update_position)
 
     def destroy(self):
         self.window.destroy()
@@ -104,7 +182,7 @@ class ScannerStats:
     items_detected: int = 0
     items_found_in_db: int = 0
     last_item: str | None = None
-    last_item_time: float = 0
+    last_item_time: float = 0  # time.monotonic() seconds
 
 
 @dataclass
@@ -124,17 +202,42 @@ class Scanner:
     state: ScannerState = ScannerState.IDLE
     stats: ScannerStats = field(default_factory=ScannerStats)
 
-    # Cooldown tracking
+    # Cooldown tracking (time.monotonic() seconds)
     _last_shown_item: str = ""
     _last_shown_time: float = 0
-    _trigger_check_counter: int = 0
+    _tooltip_scans_since_trigger_check: int = 0
+
+    # Cursor position and item name of the last tooltip OCR that found an item
+    _last_tooltip: tuple[tuple[int, int], str] | None = None
 
     # In-raid context (True when trigger_region2 detected)
     _in_raid: bool = False
 
-    # Thread control
+    # Thread control. Waiting on _stop_event instead of sleeping lets stop()
+    # wake the scan thread immediately.
     _running: bool = False
     _scan_thread: Thread | None = None
+    _stop_event: threading.Event = field(default_factory=threading.Event)
+
+    # UI updates posted by the scan thread, applied on the Tk main thread
+    _ui_queue: queue.Queue = field(default_factory=queue.Queue)
+    # Last status queued, so repeated identical statuses are not re-posted
+    _last_status: str | None = None
+
+    # Memoized, station-resolved lookups; the same hovered item is
+    # re-detected many times. Dropped when the database version changes.
+    _lookup: Callable[[str], Item | None] = field(init=False, repr=False)
+    _db_version: tuple[int, int] | None = None
+
+    def __post_init__(self) -> None:
+        self._lookup = lru_cache(maxsize=1024)(self._recommend)
+
+    def _recommend(self, item_name: str) -> Item | None:
+        """Look up an item and resolve its action for the current stations."""
+        item = self.db.lookup(item_name)
+        if item is None:
+            return None
+        return resolve_action(item, get_station_levels())
 
     def start(self) -> None:
         """Start the scanner in a background thread."""
@@ -142,6 +245,7 @@ class Scanner:
             return
 
         self._running = True
+        self._stop_event.clear()
         self.state = ScannerState.IDLE
         self._scan_thread = Thread(target=self._scan_loop, daemon=True)
         self._scan_thread.start()
@@ -151,6 +255,7 @@ class Scanner:
         """Stop the scanner."""
         self._running = False
         self.state = ScannerState.STOPPED
+        self._stop_event.set()
         if self._scan_thread:
             self._scan_thread.join(timeout=2.0)
         logger.info("Scanner stopped")
@@ -165,13 +270,19 @@ class Scanner:
 
     def _scan_loop(self) -> None:
         """Main scanning loop running in background thread."""
-        settings = get_settings()
         ocr = get_ocr_engine()
+        settings_version = None
 
         while self._running:
+            # Snapshot hot-path settings, refreshing only after a reload
+            if settings_version != SettingsManager.version():
+                settings_version = SettingsManager.version()
+                snap = ScanSnapshot.from_settings(get_settings())
+                self._lookup.cache_clear()
+
             try:
                 if self.state == ScannerState.PAUSED:
-                    time.sleep(0.1)
+                    self._stop_event.wait(0.1)
                     continue
 
                 if self.state == ScannerState.STOPPED:
@@ -181,35 +292,35 @@ class Scanner:
                 if self.state == ScannerState.IDLE:
                     self._update_status("scanning")
 
-                    trigger_idx = ocr.check_trigger_which(
-                        [settings.trigger_region, settings.trigger_region2]
-                    )
+                    trigger_idx = ocr.check_trigger_which(snap.trigger_regions)
                     if trigger_idx is not None:
                         # Trigger detected! Switch to active mode
                         self._in_raid = trigger_idx == 1  # trigger_region2 = in-raid
                         self.state = ScannerState.ACTIVE
+                        self._tooltip_scans_since_trigger_check = 0
+                        self._last_tooltip = None
                         self._update_status("active")
                         context = "in-raid" if self._in_raid else "menu"
                         logger.info(
-                            f"INVENTORY detected ({context}) - activating tooltip scanner"
+                            "INVENTORY detected (%s) - activating tooltip scanner",
+                            context,
                         )
                     else:
                         # Wait before next trigger scan
-                        time.sleep(settings.scan.trigger_scan_interval)
+                        self._stop_event.wait(snap.trigger_interval)
 
                     self.stats.trigger_scans += 1
 
                 # Phase 2: Active mode - scan tooltip
                 elif self.state == ScannerState.ACTIVE:
                     # First, verify trigger is still present
-                    # Optimization: Only check trigger every 3rd scan to save CPU
-                    self._trigger_check_counter += 1
-                    should_check_trigger = self._trigger_check_counter % 3 == 0
+                    # Optimization: Inventory opens/closes at human timescale, so
+                    # only re-check the trigger every `trigger_stride` tooltip scans
+                    self._tooltip_scans_since_trigger_check += 1
 
-                    if should_check_trigger:
-                        trigger_idx = ocr.check_trigger_which(
-                            [settings.trigger_region, settings.trigger_region2]
-                        )
+                    if self._tooltip_scans_since_trigger_check >= snap.trigger_stride:
+                        self._tooltip_scans_since_trigger_check = 0
+                        trigger_idx = ocr.check_trigger_which(snap.trigger_regions)
                         if trigger_idx is None:
                             # Inventory closed, go back to idle
                             self._in_raid = False
@@ -220,30 +331,45 @@ class Scanner:
                         # Update in-raid context in case it changed
                         self._in_raid = trigger_idx == 1
 
-                    # Scan tooltip at cursor position
-                    item_name = ocr.extract_item_name_at_cursor()
-                    self.stats.tooltip_scans += 1
+                    # Scan tooltip at cursor position. While the cursor rests on
+                    # an already recognized item, reuse that result instead of
+                    # running OCR again; the trigger re-check tick always rescans
+                    # in case the inventory scrolled under a still cursor.
+                    cursor = get_cursor_position()
+                    position = (cursor.x, cursor.y)
+                    last = self._last_tooltip
+                    if (
+                        last is not None
+                        and last[0] == position
+                        and self._tooltip_scans_since_trigger_check != 0
+                    ):
+                        item_name = last[1]
+                    else:
+                        item_name = ocr.extract_item_name_at_cursor()
+                        self.stats.tooltip_scans += 1
+                        self._last_tooltip = (
+                            (position, item_name) if item_name else None
+                        )
 
                     if item_name:
-                        self._handle_detected_item(item_name)
+                        self._handle_detected_item(item_name, snap.cooldown)
 
                     # Wait before next tooltip scan
-                    time.sleep(settings.scan.tooltip_scan_interval)
+                    self._stop_event.wait(snap.tooltip_interval)
 
             except Exception as e:  # noqa: BLE001
-                logger.error(f"Scanner error: {e}")
+                logger.error("Scanner error: %s", e)
                 self._update_status("error")
-                time.sleep(1.0)  # Back off on error
+                self._stop_event.wait(1.0)  # Back off on error
 
-    def _handle_detected_item(self, item_name: str) -> None:
+    def _handle_detected_item(self, item_name: str, cooldown: float) -> None:
         """Handle a detected item name."""
-        settings = get_settings()
-        current_time = time.time()
+        current_time = time.monotonic()
 
-        # Check cooldown - don't spam the same item
+        # Check cooldown first - don't spam the same item
         if (
             item_name == self._last_shown_item
-            and current_time - self._last_shown_time < settings.overlay.cooldown
+            and current_time - self._last_shown_time < cooldown
         ):
             return
 
@@ -251,15 +377,19 @@ class Scanner:
         self.stats.last_item = item_name
         self.stats.last_item_time = current_time
 
-        # Look up in database
-        recommendation = self.db.lookup(item_name)
+        # Look up in database, forgetting memoized results (misses included)
+        # once the items were reloaded here or by the calibration tool
+        db_version = self.db.data_version()
+        if db_version != self._db_version:
+            self._db_version = db_version
+            self._lookup.cache_clear()
+        recommendation = self._lookup(item_name)
 
         if recommendation:
-            recommendation = resolve_action(recommendation, get_station_levels())
             self.stats.items_found_in_db += 1
-            logger.debug(f"Found: {item_name} → {recommendation.action}")
+            logger.debug("Found: %s → %s", item_name, recommendation.action)
         else:
-            logger.debug(f"Unknown item: {item_name}")
+            logger.debug("Unknown item: %s", item_name)
             # Log to missing items file for easier database updates
             self.db.log_missing_item(item_name)
 
@@ -273,23 +403,39 @@ class Scanner:
     def _show_overlay(
         self, item_name: str, recommendation: Item | None, *, in_raid: bool = False
     ) -> None:
-        """Show overlay on main thread."""
-        self.root.after(
-            0, lambda: self.overlay.show(item_name, recommendation, in_raid=in_raid)
-        )
+        """Queue an overlay update for the main thread."""
+        self._ui_queue.put(("show", item_name, recommendation, in_raid))
 
     def _update_status(self, status: str) -> None:
-        """Update status display on main thread."""
-
-        def update():
-            if status == "scanning":
-                self.status.set_scanning()
-            elif status == "active":
-                self.status.set_active()
-            elif status == "error":
-                self.status.set_error("Error")
+        """Queue a status display update for the main thread."""
+        # Every idle trigger scan reports "scanning"; only changes matter
+        if status == self._last_status:
+            return
+        self._last_status = status
+        self._ui_queue.put(("status", status))
 
-        self.root.after(0, update)
+    def process_ui_updates(self) -> None:
+        """Apply all queued UI updates. Must be called on the Tk main thread."""
+        while True:
+            try:
+                message = self._ui_queue.get_nowait()
+            except queue.Empty:
+                return
+
+            if message[0] == "show":
+                _, item_name, recommendation, in_raid = message
+                self.overlay.show(item_name, recommendation, in_raid=in_raid)
+            elif message[0] == "status":
+                self._apply_status(message[1])
+
+    def _apply_status(self, status: str) -> None:
+        """Update status display."""
+        if status == "scanning":
+            self.status.set_scanning()
+        elif status == "active":
+            self.status.set_active()
+        elif status == "error":
+            self.status.set_error("Error")
 
 
 class Application:
@@ -297,6 +443,13 @@ class Application:
 
     def __init__(self):
         """Initialize the application."""
+        # Tk is only needed once calibration has passed, so the "needs
+        # calibration" exit path never pays for importing it
+        import tkinter as tk
+
+        from arc_helper.overlay import OverlayWindow
+        from arc_helper.overlay import StatusWindow
+
         # Load settings
         self.settings = get_settings()
 
@@ -314,7 +467,9 @@ class Application:
         # Debug overlay for visualizing capture area (separate from debug_mode)
         self.debug_overlay = None
         if self.settings.show_capture_area:
-            self.debug_overlay = DebugOverlay(self.root, self.settings)
+            self.debug_overlay = DebugOverlay(
+                self.root, ScanSnapshot.from_settings(self.settings)
+            )
 
         # Create scanner
         self.scanner = Scanner(
@@ -332,35 +487,29 @@ class Application:
         logger.info("=" * 50)
         logger.info("Arc Raiders Helper - Started")
         logger.info("=" * 50)
-        logger.info(f"Database: {self.db.count()} items loaded")
-        logger.info(f"Debug mode: {self.settings.debug_mode}")
+        logger.info("Database: %d items loaded", self.db.count())
+        logger.info("Debug mode: %s", self.settings.debug_mode)
         logger.info("=" * 50)
         logger.info("Trigger Region:")
-        logger.info(
-            f"  Position: ({self.settings.trigger_region.x}, {self.settings.trigger_region.y})"
-        )
-        logger.info(
-            f"  Size: {self.settings.trigger_region.width}x{self.settings.trigger_region.height}"
-        )
+        trigger = self.settings.trigger_region
+        logger.info("  Position: (%d, %d)", trigger.x, trigger.y)
+        logger.info("  Size: %dx%d", trigger.width, trigger.height)
         logger.info("Trigger Region 2:")
-        logger.info(
-            f"  Position: ({self.settings.trigger_region2.x}, {self.settings.trigger_region2.y})"
-        )
-        logger.info(
-            f"  Size: {self.settings.trigger_region2.width}x{self.settings.trigger_region2.height}"
-        )
+        trigger2 = self.settings.trigger_region2
+        logger.info("  Position: (%d, %d)", trigger2.x, trigger2.y)
+        logger.info("  Size: %dx%d", trigger2.width, trigger2.height)
         logger.info("=" * 50)
         logger.info(
-            f"Trigger scan interval: {self.settings.scan.trigger_scan_interval}s"
+            "Trigger scan interval: %ss", self.settings.scan.trigger_scan_interval
         )
         logger.info(
-            f"Tooltip scan interval: {self.settings.scan.tooltip_scan_interval}s"
+            "Tooltip scan interval: %ss", self.settings.scan.tooltip_scan_interval
         )
         logger.info("=" * 50)
         levels = get_station_levels()
         active = {k: v for k, v in levels.model_dump().items() if v > 0}
         if active:
-            logger.info(f"Station levels: {active}")
+            logger.info("Station levels: %s", active)
         else:
             logger.info("Station levels: all at 0 (resolution disabled)")
         logger.info("=" * 50)
@@ -368,8 +517,9 @@ class Application:
         logger.info("Press Ctrl+C in terminal to quit")
         logger.info("=" * 50)
 
-        # Start scanner
+        # Start scanner and the loop applying its UI updates
         self.scanner.start()
+        self._process_ui_updates()
 
         # Run Tk mainloop
         try:
@@ -377,10 +527,16 @@ class Application:
         except KeyboardInterrupt:
             self.quit()
 
+    def _process_ui_updates(self) -> None:
+        """Drain scanner UI updates at ~60 Hz on the Tk main thread."""
+        self.scanner.process_ui_updates()
+        self.root.after(16, self._process_ui_updates)
+
     def quit(self) -> None:
         """Clean shutdown."""
         logger.info("\nShutting down...")
         self.scanner.stop()
+        self.db.close()
         self.root.quit()
         self.root.destroy()
 
@@ -395,11 +551,11 @@ def check_first_run() -> bool:
     resolution = profile_manager.get_resolution_key()
 
     if profile_manager.is_uncalibrated():
-        logger.info(f"Detected resolution: {resolution}")
+        logger.info("Detected resolution: %s", resolution)
         logger.info("Settings are uncalibrated, checking for profile...")
 
         if profile_manager.has_profile():
-            logger.info(f"Found profile for {resolution}, applying...")
+            logger.info("Found profile for %s, applying...", resolution)
             profile_manager.apply_profile()
 
             # Force complete reload of everything
@@ -409,15 +565,18 @@ def check_first_run() -> bool:
             # Verify the reload worked
             new_settings = SettingsManager.get()
             logger.info(
-                f"After reload - Trigger region: ({new_settings.trigger_region.x}, {new_settings.trigger_region.y})"
+                "After reload - Trigger region: (%d, %d)",
+                new_settings.trigger_region.x,
+                new_settings.trigger_region.y,
             )
 
             logger.info("Profile applied successfully!")
             return True
         supported = profile_manager.get_supported_resolutions()
-        logger.warning(f"No pre-configured profile found for {resolution}.")
+        logger.warning("No pre-configured profile found for %s.", resolution)
         logger.info(
-            f"Supported resolutions: {', '.join(supported) if supported else 'None yet'}"
+            "Supported resolutions: %s",
+            ", ".join(supported) if supported else "None yet",
         )
         logger.info("Please run the Calibration tool to configure screen regions.")
         return False
@@ -440,14 +599,14 @@ def main() -> None:
             "".join(traceback.format_exception(exc_type, exc_value, exc_tb)),
             encoding="utf-8",
         )
-        logger.error(f"Crash log written to: {crash_log}")
+        logger.error("Crash log written to: %s", crash_log)
         sys.__excepthook__(exc_type, exc_value, exc_tb)
 
     sys.excepthook = exception_hook
 
     def thread_exception_hook(args):
         logger.error("=" * 50)
-        logger.error(f"THREAD EXCEPTION in {args.thread.name}")
+        logger.error("THREAD EXCEPTION in %s", args.thread.name)
         logger.error("=" * 50)
         logger.error(
             "".join(
@@ -470,6 +629,9 @@ def main() -> None:
     threading.excepthook = thread_exception_hook
 
     try:
+        _load_env_once()
+        get_logger()
+
         # Check first run / calibration status
         if not check_first_run():
             input("\nPress Enter to exit...")
@@ -477,7 +639,9 @@ def main() -> None:
 
         settings = get_settings()
         logger.info(
-            f"Settings loaded for resolution, trigger at ({settings.trigger_region.x}, {settings.trigger_region.y})"
+            "Settings loaded for resolution, trigger at (%d, %d)",
+            settings.trigger_region.x,
+            settings.trigger_region.y,
         )
 
         _ = get_ocr_engine()
@@ -485,7 +649,7 @@ def main() -> None:
         app.run()
 
     except Exception as e:  # noqa: BLE001
-        logger.error(f"Fatal error in main: {e}")
+        logger.error("Fatal error in main: %s", e)
         logger.error(traceback.format_exc())
         input("\nPress Enter to exit after error...")
 
@@ -5,23 +5,44 @@ Screen capture and text extraction using Tesseract.
 
 # Enable windows DPI scaling
 import ctypes
+import hashlib
+import os
 import re
 import string
+import threading
 import typing
+from collections import OrderedDict
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import as_completed
 from contextlib import suppress
+from pathlib import Path
 
 import numpy as np
 import pytesseract
 from PIL import Image
-from PIL import ImageGrab
-from PIL import ImageOps
 from pydantic import BaseModel
 
+from .capture import grab_region
 from .config import RegionMixin
 from .config import get_screen_resolution
 from .config import get_settings
 from .config import logger
 
+# Tooltips and trigger words are short; Tesseract's OpenMP threads cost more
+# in start-up and contention than they save, so run each call single threaded.
+# Set before tesserocr loads libtesseract (OpenMP reads it at load time) and
+# inherited by the tesseract subprocess; an explicit user setting wins.
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+
+try:
+    import tesserocr
+except ImportError:
+    # Optional: keeps Tesseract loaded in-process instead of spawning the
+    # tesseract executable (and reloading its language data) on every call
+    tesserocr = None
+
 try:
     # Windows 10 1607+ (most reliable)
     ctypes.windll.shcore.SetProcessDpiAwareness(2)  # PROCESS_PER_MONITOR_DPI_AWARE
@@ -31,6 +52,22 @@ except (AttributeError, OSError):
         ctypes.windll.user32.SetProcessDPIAware()
 
 
+# The trigger region holds one uppercase word, already inverted to dark on
+# light by preprocess_for_ocr: single-word segmentation skips layout analysis,
+# the whitelist narrows the search, and Tesseract's inverted retry is disabled
+_TRIGGER_CONFIG = (
+    "--oem 1 --psm 8"
+    f' -c tessedit_char_whitelist="{string.ascii_uppercase}"'
+    " -c tessedit_do_invert=0"
+)
+
+# Image.point tables binarizing 8-bit gray at 128, with and without first
+# inverting light text to dark; a table is applied in C, a lambda is not
+_THRESHOLD = 128
+_THRESHOLD_LUT = [255 if x > _THRESHOLD else 0 for x in range(256)]
+_INVERTED_THRESHOLD_LUT = [255 if 255 - x > _THRESHOLD else 0 for x in range(256)]
+
+
 class Point(BaseModel):
     """Screen coordinates."""
 
@@ -46,17 +83,24 @@ class OCRResult(BaseModel):
     raw_text: str = ""
 
 
-def get_cursor_position() -> Point:
-    """Get current cursor position on screen in physical pixels."""
+class _POINT(ctypes.Structure):
+    _fields_: typing.ClassVar = [("x", ctypes.c_long), ("y", ctypes.c_long)]
 
-    # Ensure we're DPI aware to get physical coordinates
-    ctypes.windll.user32.SetProcessDPIAware()
 
-    class POINT(ctypes.Structure):
-        _fields_: typing.ClassVar = [("x", ctypes.c_long), ("y", ctypes.c_long)]
+try:
+    _GetCursorPos = ctypes.windll.user32.GetCursorPos
+except AttributeError:
+    _GetCursorPos = None
+else:
+    _GetCursorPos.argtypes = [ctypes.POINTER(_POINT)]
+    _GetCursorPos.restype = ctypes.c_int
+
 
-    pt = POINT()
-    ctypes.windll.user32.GetCursorPos(ctypes.byref(pt))
+def get_cursor_position() -> Point:
+    """Get current cursor position on screen in physical pixels."""
+    # DPI awareness is set once at import, so coordinates are physical
+    pt = _POINT()
+    _GetCursorPos(ctypes.byref(pt))
     return Point(x=pt.x, y=pt.y)
 
 
@@ -66,6 +110,16 @@ class OCREngine:
     # The trigger word we're looking for
     TRIGGER_WORD = "INVENTORY"
 
+    # Trigger captures are compared as a 64x16 grid of lit (text) cells against
+    # the last OCR-confirmed capture of the same region; up to a tenth of the
+    # reference's lit cells may differ (anti-aliasing, hover glow)
+    TRIGGER_FINGERPRINT_SIZE = (64, 16)
+    TRIGGER_FINGERPRINT_TOLERANCE = 0.1
+
+    # Item names parsed from recently seen preprocessed tooltips, so hovering
+    # back over an item (or a tooltip that didn't change) skips OCR
+    TOOLTIP_CACHE_SIZE = 32
+
     def __init__(self):
         """Initialize OCR engine."""
         settings = get_settings()
@@ -74,6 +128,24 @@ class OCREngine:
         if settings.tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = settings.tesseract_path
 
+        # Fingerprint of the last OCR-confirmed trigger capture, per region bbox
+        self._trigger_references: dict[tuple[int, int, int, int], np.ndarray] = {}
+
+        # Item name (or None) per digest of a preprocessed tooltip, oldest first
+        self._tooltip_names: OrderedDict[bytes, str | None] = OrderedDict()
+
+        # Checks several trigger regions concurrently; created on first use
+        self._trigger_pool: ThreadPoolExecutor | None = None
+
+        # Persistent tesserocr handles, one per page segmentation mode; None
+        # means every call goes through pytesseract
+        self._trigger_api = None
+        self._tooltip_api = None
+        # Trigger regions may be checked from several pool threads at once
+        self._trigger_api_lock = threading.Lock()
+        if tesserocr is not None:
+            self._open_tesserocr(settings.tesseract_path)
+
         self.debug_mode = settings.debug_mode
         self.debug_dir = settings.debug_output_dir
 
@@ -86,13 +158,67 @@ class OCREngine:
         if self.debug_mode:
             self.debug_dir.mkdir(parents=True, exist_ok=True)
 
+    def _open_tesserocr(self, tesseract_path: str | None) -> None:
+        """Open the in-process Tesseract APIs, staying on pytesseract on failure."""
+        options = {"lang": "eng", "oem": tesserocr.OEM.LSTM_ONLY}
+        if tesseract_path:
+            # Use the traineddata shipped next to the configured executable
+            tessdata = Path(tesseract_path).parent / "tessdata"
+            if tessdata.is_dir():
+                options["path"] = f"{tessdata}{os.sep}"
+
+        try:
+            trigger_api = tesserocr.PyTessBaseAPI(
+                psm=tesserocr.PSM.SINGLE_WORD, **options
+            )
+            trigger_api.SetVariable("tessedit_char_whitelist", string.ascii_uppercase)
+            trigger_api.SetVariable("tessedit_do_invert", "0")
+            tooltip_api = tesserocr.PyTessBaseAPI(
+                psm=tesserocr.PSM.SINGLE_BLOCK, **options
+            )
+        except RuntimeError as e:
+            logger.warning("tesserocr failed to start, using pytesseract: %s", e)
+            return
+
+        self._trigger_api = trigger_api
+        self._tooltip_api = tooltip_api
+
+    def close(self) -> None:
+        """Stop the trigger pool and release the tesserocr handles."""
+        # Wait for running checks so no thread is inside a handle we end
+        if self._trigger_pool is not None:
+            self._trigger_pool.shutdown(wait=True, cancel_futures=True)
+            self._trigger_pool = None
+
+        with self._trigger_api_lock:
+            for api in (self._trigger_api, self._tooltip_api):
+                if api is not None:
+                    api.End()
+            self._trigger_api = None
+            self._tooltip_api = None
+
+    @staticmethod
+    def _run_api(api, image: Image.Image) -> str:
+        """Recognize an image with a persistent tesserocr API."""
+        # Hand over raw 8-bit gray pixels; SetImage would encode a BMP first
+        if image.mode != "L":
+            image = image.convert("L")
+        try:
+            api.SetImageBytes(
+                image.tobytes(), image.width, image.height, 1, image.width
+            )
+            return api.GetUTF8Text()
+        except RuntimeError as e:
+            logger.debug("tesserocr recognition failed: %s", e)
+            return ""
+
     @staticmethod
     def capture_region(region: RegionMixin) -> Image.Image:
         """Capture a screen region."""
         try:
-            return ImageGrab.grab(bbox=region.bbox)
+            return grab_region(region.bbox)
         except OSError as e:
-            logger.error(f"Screen grab failed for region {region.bbox}: {e}")
+            logger.error("Screen grab failed for region %s: %s", region.bbox, e)
             # Return a dummy image to avoid crashing
             return Image.new("RGB", (region.width, region.height), color="black")
 
@@ -139,36 +265,73 @@ class OCREngine:
             or bottom - top < self.tooltip_height // 2
         ):
             logger.debug(
-                f"Capture region clamped significantly: cursor=({cursor.x}, {cursor.y}), bbox=({left}, {top}, {right}, {bottom})"
+                "Capture region clamped significantly: cursor=(%d, %d), bbox=%s",
+                cursor.x,
+                cursor.y,
+                (left, top, right, bottom),
             )
 
         try:
-            image = ImageGrab.grab(bbox=(left, top, right, bottom))
+            image = grab_region((left, top, right, bottom))
         except OSError as e:
             logger.error(
-                f"Screen grab failed at bbox ({left}, {top}, {right}, {bottom}): {e}"
+                "Screen grab failed at bbox %s: %s", (left, top, right, bottom), e
             )
             # Return a dummy image to avoid crashing
             return Image.new("RGB", (100, 100), color="black"), cursor
 
         return image, cursor
 
-    def check_trigger_any(self, regions: list[RegionMixin]) -> bool:
+    def _submit_trigger_checks(
+        self, regions: Sequence[RegionMixin]
+    ) -> list[Future[bool]]:
+        """Start check_trigger for every region on the trigger pool."""
+        if self._trigger_pool is None:
+            self._trigger_pool = ThreadPoolExecutor(
+                max_workers=min(4, len(regions)), thread_name_prefix="trigger"
+            )
+        return [
+            self._trigger_pool.submit(self.check_trigger, region) for region in regions
+        ]
+
+    def check_trigger_any(self, regions: Sequence[RegionMixin]) -> bool:
         """
         Check if the trigger word (INVENTORY) is visible in any of the regions.
         """
-        return any(self.check_trigger(region) for region in regions)
+        if len(regions) < 2 or self.debug_mode:
+            return any(self.check_trigger(region) for region in regions)
+
+        futures = self._submit_trigger_checks(regions)
+        try:
+            return any(future.result() for future in as_completed(futures))
+        finally:
+            for future in futures:
+                future.cancel()
 
-    def check_trigger_which(self, regions: list[RegionMixin]) -> int | None:
+    def check_trigger_which(self, regions: Sequence[RegionMixin]) -> int | None:
         """
         Check which region (by index) contains the trigger word.
 
         Returns the index of the first matching region, or None if no match.
+        Regions are captured and recognized concurrently, but earlier regions
+        still take priority. Debug mode checks them one at a time, since every
+        check writes the same debug images.
         """
-        for idx, region in enumerate(regions):
-            if self.check_trigger(region):
-                return idx
-        return None
+        if len(regions) < 2 or self.debug_mode:
+            for idx, region in enumerate(regions):
+                if self.check_trigger(region):
+                    return idx
+            return None
+
+        futures = self._submit_trigger_checks(regions)
+        try:
+            for idx, future in enumerate(futures):
+                if future.result():
+                    return idx
+            return None
+        finally:
+            for future in futures:
+                future.cancel()
 
     @staticmethod
     def preprocess_for_ocr(
@@ -185,18 +348,17 @@ class OCREngine:
         # Convert to grayscale
         gray = image.convert("L")
 
-        # Upscale for better OCR
+        # Threshold for cleaner text, inverting in the same lookup if needed
+        # (OCR prefers black text on white)
+        lut = _INVERTED_THRESHOLD_LUT if invert else _THRESHOLD_LUT
+        gray = gray.point(lut, "1")
+
+        # Upscale for better OCR. Thresholding first means only the small
+        # image is processed in 8-bit, and the 1-bit result stays binary
+        # under nearest-neighbour
         if scale > 1:
             new_size = (gray.width * scale, gray.height * scale)
-            gray = gray.resize(new_size, Image.Resampling.BILINEAR)
-
-        # Invert if needed (OCR prefers black text on white)
-        if invert:
-            gray = ImageOps.invert(gray)
-
-        # Apply threshold for cleaner text
-        threshold = 128
-        gray = gray.point(lambda x: 255 if x > threshold else 0, "1")
+            gray = gray.resize(new_size, Image.Resampling.NEAREST)
 
         return gray
 
@@ -205,22 +367,25 @@ class OCREngine:
         Preprocess tooltip image by isolating the cream-colored tooltip background
         and extracting dark text from it.
         """
-        img_array = np.array(image)
-
-        # Tooltip background is #f9eedf = RGB(249, 238, 223)
-        lower_bound = np.array([240, 225, 210])
-        upper_bound = np.array([255, 250, 240])
-
-        # Create mask for tooltip background
-        mask = np.all((img_array >= lower_bound) & (img_array <= upper_bound), axis=2)
-
-        # Find rows and columns that are predominantly cream (>50%)
-        row_cream_percentage = np.sum(mask, axis=1) / mask.shape[1]
-        col_cream_percentage = np.sum(mask, axis=0) / mask.shape[0]
-
-        # Find first/last row with significant cream
-        cream_rows = np.where(row_cream_percentage > 0.5)[0]
-        cream_cols = np.where(col_cream_percentage > 0.3)[0]
+        # Read-only view of the capture: every step below builds new arrays
+        img_array = np.asarray(image)
+
+        # Tooltip background is #f9eedf = RGB(249, 238, 223), matched within
+        # R 240-255, G 225-250, B 210-240. Comparing each uint8 channel plane
+        # in place avoids the int64 upcast and HxWx3 temporaries of comparing
+        # against bound arrays.
+        red, green, blue = img_array[:, :, 0], img_array[:, :, 1], img_array[:, :, 2]
+        mask = red >= 240
+        mask &= green >= 225
+        mask &= green <= 250
+        mask &= blue >= 210
+        mask &= blue <= 240
+
+        # Find rows that are predominantly cream (>50%) and columns with
+        # significant cream (>30%), comparing integer counts directly
+        height, width = mask.shape
+        cream_rows = np.flatnonzero(np.count_nonzero(mask, axis=1) * 2 > width)
+        cream_cols = np.flatnonzero(np.count_nonzero(mask, axis=0) * 10 > height * 3)
 
         if len(cream_rows) == 0 or len(cream_cols) == 0:
             result = Image.new("L", (image.width * 2, image.height * 2), 255)
@@ -234,8 +399,9 @@ class OCREngine:
         cropped_mask = mask[y_min:y_max, x_min:x_max]
 
         # Find columns that are mostly cream
-        col_cream_pct = np.sum(cropped_mask, axis=0) / cropped_mask.shape[0]
-        tight_cols = np.where(col_cream_pct > 0.5)[0]
+        tight_cols = np.flatnonzero(
+            np.count_nonzero(cropped_mask, axis=0) * 2 > cropped_mask.shape[0]
+        )
 
         if len(tight_cols) == 0:
             result = Image.new("L", (image.width * 2, image.height * 2), 255)
@@ -258,11 +424,14 @@ class OCREngine:
         color_diff = max_rgb - min_rgb
 
         # Colored pixels: significant difference between channels AND not too dark AND not too bright
-        is_colored = (color_diff > 30) & (max_rgb > 80) & (max_rgb < 240)
+        is_colored = color_diff > 30
+        is_colored &= max_rgb > 80
+        is_colored &= max_rgb < 240
 
         # Count colored pixels per row - only exclude rows with SIGNIFICANT color (>5% of row)
-        row_color_percentage = np.sum(is_colored, axis=1) / is_colored.shape[1]
-        row_has_significant_color = row_color_percentage > 0.05
+        row_has_significant_color = (
+            np.count_nonzero(is_colored, axis=1) * 20 > is_colored.shape[1]
+        )
 
         # Create output - white background
         result = (
@@ -270,8 +439,9 @@ class OCREngine:
             * 255
         )
 
-        # Only include dark text from rows WITHOUT significant colored pixels
-        is_dark = np.all(tight_cropped < 100, axis=2)
+        # Only include dark text from rows WITHOUT significant colored pixels;
+        # a pixel is dark when even its brightest channel is below 100
+        is_dark = max_rgb < 100
 
         # Vectorized masking: rows without significant color AND dark pixels
         mask = (~row_has_significant_color[:, np.newaxis]) & is_dark
@@ -280,10 +450,11 @@ class OCREngine:
         # Convert to PIL
         result_image = Image.fromarray(result, mode="L")
 
-        # Upscale for better OCR
+        # Upscale for better OCR; the mask is already pure black/white, so
+        # nearest-neighbour keeps it binary and is cheaper than interpolating
         scale = 2
         new_size = (result_image.width * scale, result_image.height * scale)
-        result_image = result_image.resize(new_size, Image.Resampling.BILINEAR)
+        result_image = result_image.resize(new_size, Image.Resampling.NEAREST)
 
         # Debug: save intermediate images
         if self.debug_mode:
@@ -367,7 +538,7 @@ class OCREngine:
 
         except pytesseract.TesseractError as e:
             if self.debug_mode:
-                logger.error(f"OCR Error: {e}")
+                logger.error("OCR Error: %s", e)
             return OCRResult(text=None, confidence=0, raw_text="")
 
     @staticmethod
@@ -385,11 +556,34 @@ class OCREngine:
         Check if the trigger word (INVENTORY) is visible in the region.
 
         This is optimized for speed - we just need to detect the word,
-        not extract it perfectly.
+        not extract it perfectly. Once OCR has confirmed the word in a
+        region, a capture that looks the same is accepted without OCR.
         """
-        # Capture
         image = self.capture_region(region)
 
+        fingerprint = self._trigger_fingerprint(image)
+        reference = self._trigger_references.get(region.bbox)
+        if reference is not None:
+            allowed = np.count_nonzero(reference) * self.TRIGGER_FINGERPRINT_TOLERANCE
+            if np.count_nonzero(fingerprint != reference) <= allowed:
+                return True
+
+        found = self.check_trigger_image(image)
+        if found and fingerprint.any():
+            self._trigger_references[region.bbox] = fingerprint
+        return found
+
+    @classmethod
+    def _trigger_fingerprint(cls, image: Image.Image) -> np.ndarray:
+        """Reduce a trigger capture to a small grid of bright (text) cells."""
+        small = image.convert("L").resize(
+            cls.TRIGGER_FINGERPRINT_SIZE, Image.Resampling.BILINEAR
+        )
+        # Same cut-off preprocess_for_ocr uses for the light trigger text
+        return np.asarray(small) > 128
+
+    def check_trigger_image(self, image: Image.Image) -> bool:
+        """Check an already captured trigger region for the trigger word."""
         # Preprocess
         processed = self.preprocess_for_ocr(image, invert=True, scale=2)
 
@@ -399,15 +593,18 @@ class OCREngine:
             processed.save(self.debug_dir / "trigger_processed.png")
 
         # Extract with limited whitelist for speed using image_to_string (faster than image_to_data)
-        config = f'--psm 7 -c tessedit_char_whitelist="{string.ascii_uppercase}"'
-        try:
-            text = pytesseract.image_to_string(processed, config=config)
-            if text:
-                # Fuzzy match - allow for some OCR errors
-                return self._fuzzy_match(text.strip().upper(), self.TRIGGER_WORD)
-        except pytesseract.TesseractError:
-            pass
-
+        if self._trigger_api is not None:
+            with self._trigger_api_lock:
+                text = self._run_api(self._trigger_api, processed)
+        else:
+            try:
+                text = pytesseract.image_to_string(processed, config=_TRIGGER_CONFIG)
+            except pytesseract.TesseractError:
+                return False
+
+        if text:
+            # Fuzzy match - allow for some OCR errors
+            return self._fuzzy_match(text.strip().upper(), self.TRIGGER_WORD)
         return False
 
     def extract_item_name_at_cursor(self) -> str | None:
@@ -442,23 +639,50 @@ class OCREngine:
 
         # Extract all text from the tooltip area
         try:
-            # Use PSM 6 for block of text, then parse out the item name
-            text = pytesseract.image_to_string(processed, config="--psm 6")
-
-            logger.debug(f"Raw tooltip OCR:\n{text}")
-
-            # Parse the text to find the item name
-            item_name = self.parse_item_name_from_tooltip(text)
+            item_name = self.read_item_name(processed)
 
             if item_name:
-                logger.debug(f"Extracted item name: '{item_name}'")
+                logger.debug("Extracted item name: '%s'", item_name)
                 return item_name
 
         except pytesseract.TesseractError as e:
-            logger.error(f"OCR Error: {e}")
+            logger.error("OCR Error: %s", e)
 
         return None
 
+    def read_item_name(self, processed: Image.Image) -> str | None:
+        """
+        Read the item name from a preprocessed tooltip image.
+
+        Identical images always OCR the same way, so results are cached by
+        a digest of the pixels.
+        """
+        # An all-white mask means no tooltip (or no dark text on it) was found
+        if processed.getextrema() == (255, 255):
+            return None
+
+        key = hashlib.blake2b(processed.tobytes(), digest_size=16).digest()
+        cache = self._tooltip_names
+        if key in cache:
+            cache.move_to_end(key)
+            return cache[key]
+
+        # Read as a block of text, then parse out the item name
+        text = self.read_tooltip_text(processed)
+        logger.debug("Raw tooltip OCR:\n%s", text)
+        item_name = self.parse_item_name_from_tooltip(text)
+
+        cache[key] = item_name
+        if len(cache) > self.TOOLTIP_CACHE_SIZE:
+            cache.popitem(last=False)
+        return item_name
+
+    def read_tooltip_text(self, processed: Image.Image) -> str:
+        """Run block-of-text OCR (PSM 6) on a preprocessed tooltip image."""
+        if self._tooltip_api is not None:
+            return self._run_api(self._tooltip_api, processed)
+        return pytesseract.image_to_string(processed, config="--psm 6")
+
     def parse_item_name_from_tooltip(self, text: str) -> str | None:
         """
         Parse item name from tooltip OCR text.
@@ -517,10 +741,9 @@ class OCREngine:
             processed.save(self.debug_dir / "tooltip_processed.png")
 
         try:
-            text = pytesseract.image_to_string(processed, config="--psm 6")
-            return self.parse_item_name_from_tooltip(text)
+            return self.read_item_name(processed)
         except pytesseract.TesseractError as e:
-            logger.error(f"OCR Error: {e}")
+            logger.error("OCR Error: %s", e)
             return None
 
     @staticmethod
@@ -559,6 +782,8 @@ class OCREngineManager:
     @classmethod
     def reset(cls) -> None:
         """Reset the singleton (mainly for testing or reloading settings)."""
+        if cls._instance is not None:
+            cls._instance.close()
         cls._instance = None
 
 
@@ -70,7 +70,7 @@ class ResolutionProfileManager:
                     tooltip_capture=profile_data.get("tooltip_capture", {}),
                 )
         except (json.JSONDecodeError, KeyError) as e:
-            logger.warning(f"Warning: Failed to load resolution profiles: {e}")
+            logger.warning("Warning: Failed to load resolution profiles: %s", e)
 
     def get_resolution_key(self) -> str:
         """Get the current screen resolution as a string key."""
@@ -132,11 +132,10 @@ class ResolutionProfileManager:
             }
         )
 
-        # Save to .env file
+        # Save to .env file; save_to_env also mirrors the values into
+        # os.environ, so the saved object can be used as is without re-reading
         new_settings.save_to_env()
-
-        # Reload settings
-        SettingsManager.reload()
+        SettingsManager.replace(new_settings)
 
         return True
 
@@ -0,0 +1,104 @@
+"""Tests for config module."""
+
+import os
+from pathlib import Path
+
+import pytest
+
+from arc_helper.config import OverlaySettings
+from arc_helper.config import Settings
+from arc_helper.config import TooltipCaptureSettings
+from arc_helper.config import TriggerRegion
+from arc_helper.config import parse_env_file
+
+
+class TestEnvFileParsing:
+    """Tests for the shared .env parse."""
+
+    def test_nested_models_share_one_parse(self, temp_env_path: Path):
+        """Models reading the same unchanged .env reuse a single parse."""
+        temp_env_path.write_text(
+            "TOOLTIP_CAPTURE_WIDTH=640\nOVERLAY_X=250\n", encoding="utf-8"
+        )
+        parse_env_file.cache_clear()
+
+        capture = TooltipCaptureSettings(_env_file=temp_env_path)
+        overlay = OverlaySettings(_env_file=temp_env_path)
+
+        assert capture.width == 640
+        assert overlay.x == 250
+        info = parse_env_file.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_edited_file_is_reparsed(self, temp_env_path: Path):
+        """Rewriting the .env invalidates the cached parse."""
+        temp_env_path.write_text("TOOLTIP_CAPTURE_WIDTH=640\n", encoding="utf-8")
+        assert TooltipCaptureSettings(_env_file=temp_env_path).width == 640
+
+        temp_env_path.write_text("TOOLTIP_CAPTURE_WIDTH=800\n", encoding="utf-8")
+        stat = temp_env_path.stat()
+        os.utime(temp_env_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        assert TooltipCaptureSettings(_env_file=temp_env_path).width == 800
+
+
+class TestSaveToEnv:
+    """Tests for writing settings back to .env."""
+
+    def test_round_trip_and_environ(
+        self, temp_env_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Saved values land in the file and in os.environ."""
+        for key in ("OVERLAY_X", "STATION_SCRAPPY", "DEBUG_MODE"):
+            monkeypatch.delenv(key, raising=False)
+        settings = Settings()
+        settings.overlay.x = 250
+        settings.stations.scrappy = 3
+        settings.debug_mode = False
+
+        settings.save_to_env(temp_env_path)
+
+        text = temp_env_path.read_text(encoding="utf-8")
+        assert "OVERLAY_X=250\n" in text
+        assert "STATION_SCRAPPY=3\n" in text
+        assert "DEBUG_MODE=false\n" in text
+        assert os.environ["OVERLAY_X"] == "250"
+        assert os.environ["STATION_SCRAPPY"] == "3"
+
+    def test_only_explicit_paths_are_written(
+        self, temp_env_path: Path, monkeypatch: pytest.MonkeyPatch
+    ):
+        """Configured paths persist; auto-detected ones stay unset."""
+        for key in ("TESSERACT_PATH", "DATABASE_PATH", "TOOLTIP_REGION_X"):
+            monkeypatch.delenv(key, raising=False)
+        settings = Settings(tesseract_path="C:/Tesseract/tesseract.exe")
+
+        settings.save_to_env(temp_env_path)
+
+        text = temp_env_path.read_text(encoding="utf-8")
+        assert "TESSERACT_PATH=C:/Tesseract/tesseract.exe\n" in text
+        assert "DATABASE_PATH=" not in text
+        assert "TOOLTIP_REGION_X=" in text
+
+
+class TestRegionBbox:
+    """Tests for the region bbox."""
+
+    def test_bbox_follows_assignment(self):
+        """Assigning a coordinate drops the cached bbox."""
+        region = TriggerRegion(x=10, y=20, width=30, height=40)
+        assert region.bbox == (10, 20, 40, 60)
+
+        region.width = 50
+
+        assert region.bbox == (10, 20, 60, 60)
+
+    def test_bbox_follows_model_copy(self):
+        """A copy with updated coordinates reports its own bbox."""
+        region = TriggerRegion(x=1, y=2, width=3, height=4)
+        assert region.bbox == (1, 2, 4, 6)
+
+        moved = region.model_copy(update={"x": 100})
+
+        assert moved.bbox == (100, 2, 103, 6)
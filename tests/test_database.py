@@ -2,6 +2,8 @@
 
 from pathlib import Path
 
+import pytest
+
 from arc_helper.database import Database
 from arc_helper.database import Item
 
@@ -69,6 +71,46 @@ class TestDatabase:
         assert item is not None
         assert item.name == "Sell Item"
 
+    def test_lookup_substring_match(self, temp_db_path: Path, sample_csv_file: Path):
+        """Lookup falls back to the shortest name containing the query."""
+        db = Database(temp_db_path)
+        db.load_csv(sample_csv_file)
+
+        item = db.lookup("recycle")
+        assert item is not None
+        assert item.name == "Recycle Item"
+
+    def test_lookup_sees_reloaded_items(
+        self, temp_db_path: Path, sample_csv_file: Path, tmp_path: Path
+    ):
+        """Reloading the CSV refreshes the in-memory lookup index."""
+        db = Database(temp_db_path)
+        db.load_csv(sample_csv_file)
+        assert db.lookup("Sell Item") is not None
+
+        new_csv = tmp_path / "new_items.csv"
+        new_csv.write_text("name,action\nNew Item,Keep\n", encoding="utf-8")
+        db.load_csv(new_csv)
+
+        assert db.lookup("Sell Item") is None
+        assert db.lookup("new item").action == "Keep"
+
+    def test_lookup_sees_other_connection_writes(
+        self, temp_db_path: Path, sample_csv_file: Path, tmp_path: Path
+    ):
+        """Items loaded through another connection reach the lookup index."""
+        helper = Database(temp_db_path)
+        helper.load_csv(sample_csv_file)
+        assert helper.lookup("New Item") is None
+        version = helper.data_version()
+
+        new_csv = tmp_path / "new_items.csv"
+        new_csv.write_text("name,action\nNew Item,Keep\n", encoding="utf-8")
+        Database(temp_db_path).load_csv(new_csv)
+
+        assert helper.data_version() != version
+        assert helper.lookup("New Item").action == "Keep"
+
     def test_lookup_not_found(self, temp_db_path: Path, sample_csv_file: Path):
         """Lookup returns None for unknown items."""
         db = Database(temp_db_path)
@@ -87,6 +129,17 @@ class TestDatabase:
         assert all(isinstance(i, Item) for i in items)
         assert any(i.sell_price == "1000" for i in items)
 
+    def test_get_items_pages(self, temp_db_path: Path, sample_csv_file: Path):
+        """Paged lookups follow get_all_items ordering."""
+        db = Database(temp_db_path)
+        db.load_csv(sample_csv_file)
+
+        all_names = [i.name for i in db.get_all_items()]
+        first = db.get_items(0, 2)
+        rest = db.get_items(2, 2)
+        assert [i.name for i in first + rest] == all_names
+        assert len(rest) == 1
+
     def test_clear(self, temp_db_path: Path, sample_csv_file: Path):
         """Clear removes all items."""
         db = Database(temp_db_path)
@@ -96,6 +149,43 @@ class TestDatabase:
         db.clear()
         assert db.count() == 0
 
+    def test_iter_load_csv_yields_progress(
+        self, temp_db_path: Path, sample_csv_file: Path
+    ):
+        """Batched CSV loading reports progress and commits when exhausted."""
+        db = Database(temp_db_path)
+        loader = db.iter_load_csv(sample_csv_file, batch_size=2)
+
+        assert next(loader) == (2, 3, 2)
+        assert next(loader) == (3, 3, 3)
+        with pytest.raises(StopIteration):
+            next(loader)
+
+        assert db.count() == 3
+
+    def test_iter_load_csv_writes_only_at_the_end(
+        self, temp_db_path: Path, sample_csv_file: Path, tmp_path: Path
+    ):
+        """A paused load writes nothing, so a clear cannot commit half of it."""
+        db = Database(temp_db_path)
+        db.load_csv(sample_csv_file)
+
+        big_csv = tmp_path / "big.csv"
+        big_csv.write_text(
+            "name,action\n" + "".join(f"Item {i},Keep\n" for i in range(500)),
+            encoding="utf-8",
+        )
+        loader = db.iter_load_csv(big_csv)
+        next(loader)
+        assert db.count() == 3
+
+        db.clear()
+        assert db.count() == 0
+
+        for _ in loader:
+            pass
+        assert db.count() == 500
+
     def test_csv_without_sell_price(self, temp_db_path: Path, tmp_path: Path):
         """CSV without sell_price column loads successfully."""
         csv_content = """name,action,recycle_for,keep_for
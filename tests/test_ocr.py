@@ -0,0 +1,123 @@
+"""Tests for OCR module."""
+
+import threading
+from unittest.mock import Mock
+from unittest.mock import patch
+
+from PIL import Image
+from PIL import ImageDraw
+
+from arc_helper.config import TriggerRegion
+from arc_helper.ocr import OCREngine
+
+
+def _trigger_capture(text: str) -> Image.Image:
+    """Render light text on a dark strip, like the in-game trigger word."""
+    image = Image.new("RGB", (173, 44), "black")
+    ImageDraw.Draw(image).text((6, 6), text, fill="white", font_size=28)
+    return image
+
+
+class TestCheckTrigger:
+    """Tests for trigger detection."""
+
+    def test_confirmed_capture_skips_ocr(self):
+        """A capture matching the last OCR-confirmed one is accepted directly."""
+        engine = OCREngine()
+        region = TriggerRegion(x=0, y=0, width=173, height=44)
+        capture = _trigger_capture("INVENTORY")
+
+        with (
+            patch.object(engine, "capture_region", return_value=capture),
+            patch.object(engine, "check_trigger_image", return_value=True) as ocr,
+        ):
+            assert engine.check_trigger(region)
+            assert engine.check_trigger(region)
+
+        assert ocr.call_count == 1
+
+    def test_different_capture_runs_ocr(self):
+        """A capture unlike the confirmed one goes back to OCR."""
+        engine = OCREngine()
+        region = TriggerRegion(x=0, y=0, width=173, height=44)
+        captures = [_trigger_capture("INVENTORY"), _trigger_capture("MAP")]
+
+        with (
+            patch.object(engine, "capture_region", side_effect=captures),
+            patch.object(
+                engine, "check_trigger_image", side_effect=[True, False]
+            ) as ocr,
+        ):
+            assert engine.check_trigger(region)
+            assert not engine.check_trigger(region)
+
+        assert ocr.call_count == 2
+
+
+class TestReadItemName:
+    """Tests for reading item names from preprocessed tooltips."""
+
+    def test_repeated_tooltip_skips_ocr(self):
+        """An identical preprocessed tooltip reuses the parsed item name."""
+        engine = OCREngine()
+        tooltip = _trigger_capture("RUSTED GEAR").convert("L")
+
+        with patch.object(
+            engine, "read_tooltip_text", return_value="RUSTED GEAR\nRecycle"
+        ) as ocr:
+            assert engine.read_item_name(tooltip) == "RUSTED GEAR"
+            assert engine.read_item_name(tooltip.copy()) == "RUSTED GEAR"
+
+        assert ocr.call_count == 1
+
+    def test_blank_tooltip_skips_ocr(self):
+        """A capture without a tooltip never reaches Tesseract."""
+        engine = OCREngine()
+        no_tooltip = Image.new("RGB", (200, 120), "black")
+
+        with patch.object(engine, "read_tooltip_text") as ocr:
+            assert engine.read_item_name(engine.preprocess_tooltip(no_tooltip)) is None
+
+        ocr.assert_not_called()
+
+
+class TestCheckTriggerWhich:
+    """Tests for checking several trigger regions at once."""
+
+    def test_earlier_region_wins(self):
+        """The lowest matching index is returned even when checked in parallel."""
+        engine = OCREngine()
+        menu = TriggerRegion(x=0, y=0, width=173, height=44)
+        raid = TriggerRegion(x=0, y=100, width=173, height=44)
+
+        with patch.object(engine, "check_trigger", return_value=True):
+            assert engine.check_trigger_which([menu, raid]) == 0
+
+        with patch.object(
+            engine, "check_trigger", side_effect=lambda region: region is raid
+        ):
+            assert engine.check_trigger_which([menu, raid]) == 1
+            assert engine.check_trigger_any([menu, raid])
+
+        with patch.object(engine, "check_trigger", return_value=False):
+            assert engine.check_trigger_which([menu, raid]) is None
+            assert not engine.check_trigger_any([menu, raid])
+
+    def test_close_releases_pool_and_apis(self):
+        """Closing the engine stops its pool threads and ends tesserocr handles."""
+        fake_tesserocr = Mock()
+        with patch("arc_helper.ocr.tesserocr", fake_tesserocr):
+            engine = OCREngine()
+        regions = [
+            TriggerRegion(x=0, y=0, width=173, height=44),
+            TriggerRegion(x=0, y=100, width=173, height=44),
+        ]
+
+        with patch.object(engine, "check_trigger", return_value=False):
+            engine.check_trigger_which(regions)
+        assert any(t.name.startswith("trigger") for t in threading.enumerate())
+
+        engine.close()
+
+        assert not any(t.name.startswith("trigger") for t in threading.enumerate())
+        assert fake_tesserocr.PyTessBaseAPI.return_value.End.call_count == 2